@@ -0,0 +1,257 @@
+import argparse
+import ast
+import contextlib
+import hashlib
+import io
+import json
+import os
+import runpy
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# CONSTRUCCIÓN INCREMENTAL DEL INFORME
+# Cada archivo de outputs/ se asocia al script o a la función (con sus
+# parámetros) que lo genera. Se calcula un hash de esas entradas y solo se
+# regeneran los archivos cuyo hash cambió. Los independientes se generan en
+# paralelo y el PDF se rearma al final si cambió alguna de sus entradas.
+#
+#   python3 construir_informe.py             # reconstruye lo desactualizado
+#   python3 construir_informe.py --dry-run   # solo muestra qué se reconstruiría
+#   python3 construir_informe.py --force punto_6.png
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT, 'src')
+OUTPUTS_DIR = os.path.join(ROOT, 'outputs')
+INFORME_DIR = os.path.join(ROOT, 'informe')
+STATE_FILE = os.path.join(OUTPUTS_DIR, '.build_state.json')
+
+# Artefacto -> cómo se genera.
+#   script: se ejecuta el script completo como __main__
+#   call:   se llama a module.function(**kwargs)
+# Los .txt guardan la salida estándar y los .png la figura que se muestra.
+ARTIFACTS = {
+    'punto_3.txt': {'script': 'punto_3.py'},
+    'punto_4.txt': {'script': 'punto_4.py'},
+    'punto_5.png': {'script': 'punto_5.py'},
+    'punto_6.txt': {'call': ('punto_6y7', 'report_optimal_params'),
+                    'kwargs': {'with_air_resistance': False}},
+    'punto_7.txt': {'call': ('punto_6y7', 'report_optimal_params'),
+                    'kwargs': {'with_air_resistance': True}},
+    'punto_6.png': {'script': 'grafico_punto_6.py'},
+    'punto_7.png': {'script': 'grafico_punto_7.py'},
+    'punto_6_sim.png': {'call': ('simulacion_punto_6y7', 'plot_simulation'),
+                        'kwargs': {'k1': 13, 'k2': 1.17, 'with_air_resistance': False}},
+    'punto_7_sim.png': {'call': ('simulacion_punto_6y7', 'plot_simulation'),
+                        'kwargs': {'k1': 7, 'k2': 1.17, 'with_air_resistance': True}},
+}
+
+PDF_INPUTS = ['informe.md', 'informe_a_pdf.py']
+
+
+# HASH DE LAS ENTRADAS
+
+def local_imports(module_name):
+    """Módulos de src/ importados directamente por un módulo de src/."""
+    with open(os.path.join(SRC_DIR, module_name + '.py'), encoding='utf-8') as file:
+        tree = ast.parse(file.read())
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module)
+    return {name for name in names if os.path.exists(os.path.join(SRC_DIR, name + '.py'))}
+
+
+def module_source(module_name, include_main):
+    """
+    Código de un módulo normalizado con ast. Si include_main es False se
+    descarta el bloque if __name__ == "__main__", que no se ejecuta cuando
+    el módulo se importa.
+    """
+    with open(os.path.join(SRC_DIR, module_name + '.py'), encoding='utf-8') as file:
+        tree = ast.parse(file.read())
+    if not include_main:
+        tree.body = [node for node in tree.body if not _is_main_block(node)]
+    return ast.dump(tree)
+
+
+def _is_main_block(node):
+    return (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            and isinstance(node.test.left, ast.Name) and node.test.left.id == '__name__')
+
+
+def artifact_hash(name):
+    """
+    Hash de todo lo que determina un artefacto: su especificación, el código
+    del módulo principal y el de los módulos locales que importa (sin sus
+    bloques principales). Los comentarios y el formato no influyen.
+    """
+    spec = ARTIFACTS[name]
+    if 'script' in spec:
+        main_module = spec['script'][:-3]
+        include_main = True
+    else:
+        main_module = spec['call'][0]
+        include_main = False
+
+    digest = hashlib.sha256(json.dumps(spec, sort_keys=True).encode())
+    pending, seen = [main_module], set()
+    while pending:
+        module_name = pending.pop()
+        if module_name in seen:
+            continue
+        seen.add(module_name)
+        source = module_source(module_name, include_main and module_name == main_module)
+        digest.update(module_name.encode() + source.encode())
+        pending.extend(sorted(local_imports(module_name)))
+    return digest.hexdigest()
+
+
+def pdf_hash():
+    """El PDF depende del informe, del script de conversión y de todos los artefactos."""
+    digest = hashlib.sha256()
+    paths = [os.path.join(INFORME_DIR, name) for name in PDF_INPUTS]
+    paths += [os.path.join(OUTPUTS_DIR, name) for name in sorted(ARTIFACTS)]
+    for path in paths:
+        # Rutas relativas: el estado no depende de dónde está el repositorio
+        digest.update(os.path.relpath(path, ROOT).encode())
+        if os.path.exists(path):
+            with open(path, 'rb') as file:
+                digest.update(file.read())
+    return digest.hexdigest()
+
+
+def load_state():
+    if os.path.exists(STATE_FILE):
+        with open(STATE_FILE) as file:
+            return json.load(file)
+    return {}
+
+
+def save_state(state):
+    with open(STATE_FILE, 'w') as file:
+        json.dump(state, file, indent=2, sort_keys=True)
+
+
+# GENERACIÓN DE UN ARTEFACTO (corre en un proceso aparte)
+
+def collapse_progress(text):
+    """
+    Deja cada línea como se vería en la terminal: lo escrito después del
+    último retorno de carro pisa lo anterior (barras de progreso).
+    """
+    lines = []
+    for line in text.split('\n'):
+        parts = line.split('\r')
+        shown = parts[0]
+        for part in parts[1:]:
+            shown = part + shown[len(part):]
+        lines.append(shown.rstrip())
+    return '\n'.join(lines)
+
+
+def generate_artifact(name):
+    """Genera un artefacto dentro del proceso actual."""
+    spec = ARTIFACTS[name]
+    output_path = os.path.join(OUTPUTS_DIR, name)
+
+    os.chdir(SRC_DIR)
+    sys.path.insert(0, SRC_DIR)
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    def save_figure():
+        plt.gcf().savefig(output_path)
+        plt.close('all')
+
+    # Los scripts muestran la figura con plt.show(); acá se guarda en disco
+    plt.show = save_figure
+
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        if 'script' in spec:
+            runpy.run_path(os.path.join(SRC_DIR, spec['script']), run_name='__main__')
+        else:
+            module_name, function_name = spec['call']
+            module = __import__(module_name)
+            getattr(module, function_name)(**spec.get('kwargs', {}))
+
+    if name.endswith('.txt'):
+        with open(output_path, 'w', encoding='utf-8') as file:
+            file.write(collapse_progress(buffer.getvalue()))
+
+
+def run_in_subprocess(name):
+    """Genera un artefacto en un intérprete nuevo (aislando matplotlib)."""
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), '--generate', name],
+                            capture_output=True, text=True)
+    return name, result.returncode, result.stderr
+
+
+# CONSTRUCCIÓN
+
+def build(force=(), dry_run=False, jobs=None, skip_pdf=False):
+    state = load_state()
+    hashes = {name: artifact_hash(name) for name in ARTIFACTS}
+
+    stale = [name for name in ARTIFACTS
+             if name in force
+             or state.get(name) != hashes[name]
+             or not os.path.exists(os.path.join(OUTPUTS_DIR, name))]
+
+    print(f"Artefactos desactualizados: {', '.join(stale) if stale else 'ninguno'}")
+    if dry_run:
+        return stale
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        for name, returncode, stderr in pool.map(run_in_subprocess, stale):
+            if returncode == 0:
+                state[name] = hashes[name]
+                print(f"  [ok] {name}")
+            else:
+                failed.append(name)
+                print(f"  [error] {name}\n{stderr}")
+            save_state(state)
+
+    if failed:
+        print("No se rearma el PDF porque fallaron algunos artefactos.")
+        return stale
+
+    if skip_pdf:
+        return stale
+
+    current_pdf_hash = pdf_hash()
+    if 'informe.pdf' in force or state.get('informe.pdf') != current_pdf_hash:
+        print("Rearmando informe.pdf...")
+        result = subprocess.run([sys.executable, 'informe_a_pdf.py'], cwd=INFORME_DIR,
+                                capture_output=True, text=True)
+        if result.returncode == 0:
+            state['informe.pdf'] = current_pdf_hash
+            save_state(state)
+            print("  [ok] informe.pdf")
+        else:
+            print(f"  [error] informe.pdf\n{result.stderr}")
+    else:
+        print("informe.pdf está al día.")
+    return stale
+
+
+# EJECUCIÓN PRINCIPAL
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconstruye outputs/ y el informe de forma incremental")
+    parser.add_argument('--force', nargs='*', default=[], help="Artefactos a regenerar igual")
+    parser.add_argument('--dry-run', action='store_true')
+    parser.add_argument('--jobs', type=int, default=None)
+    parser.add_argument('--no-pdf', action='store_true')
+    parser.add_argument('--generate', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.generate:
+        generate_artifact(args.generate)
+    else:
+        build(force=set(args.force), dry_run=args.dry_run, jobs=args.jobs, skip_pdf=args.no_pdf)
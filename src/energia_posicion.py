@@ -0,0 +1,156 @@
+import numpy as np
+import punto_6y7 as bd
+
+# PRIMERA CAÍDA INTEGRANDO LA ENERGÍA EN FUNCIÓN DE LA POSICIÓN
+#
+# Durante la primera caída v >= 0, así que y es monótona y se puede usar
+# como variable independiente. Con E = v^2 / 2:
+#
+#   dE/dy = g - F_cuerda(y) / m - c1 (2E)^(c2/2) / m
+#
+# Se integra con RK4 en y desde 0 hasta el intervalo donde E se hace
+# negativa. En ese último tramo se invierte el problema y se integra
+#
+#   dy/dE = 1 / (dE/dy)
+#
+# desde el E del último paso hasta E = 0: en el punto más bajo dE/dy = a
+# es distinta de cero, así que y(E) es regular y el punto de retorno sale
+# directamente (sin buscar raíces ni pasar por v ~ 0 en el tiempo).
+#
+# La aceleración a = g - k1 (y_max - L0)^k2 / m amplifica el error de y_max
+# por k1 k2 (y_max - L0)^(k2-1) / m, que con k2 ~ 20 es del orden de 1e5.
+# Por eso el paso se achica también cuando dE/dy cambia más que
+# SLOPE_CHANGE (|dE/dy| + g) dentro de él: con DY = 0.5 el error relativo
+# de a queda por debajo de ~5e-5 hasta k2 = 20 (y el de y_max en ~1e-5 m).
+# Todo está vectorizado sobre arrays de candidatos (k1, k2).
+
+DY = 0.5  # Paso en posición [m]
+ROOT_SUBSTEPS = 4  # Pasos de RK4 en E para el último tramo
+SLOPE_CHANGE = 1.0  # Cambio relativo máximo de dE/dy dentro de un paso
+
+
+def _energy_slope(y, energy, k1, k2, with_air_resistance, m, L0):
+    """dE/dy para arrays de estados y candidatos."""
+    stretch = np.maximum(y - L0, 0.0)
+    slope = bd.g - k1 * stretch ** k2 / m
+    if with_air_resistance:
+        # Se recorta E >= 0 para que (2E)^(c2/2) esté definida en las etapas
+        slope = slope - bd.c1 * (2.0 * np.maximum(energy, 0.0)) ** (bd.c2 / 2.0) / m
+    return slope
+
+
+def _free_fall_energy(with_air_resistance, dy, m, L0):
+    """
+    Energía al llegar a L0 (cuerda todavía floja). Es igual para todos los
+    candidatos, así que se calcula una sola vez.
+    """
+    if not with_air_resistance:
+        return bd.g * L0, 0
+
+    n_steps = int(np.ceil(L0 / dy))
+    step = L0 / n_steps
+    y, energy = 0.0, 0.0
+    for _ in range(n_steps):
+        s1 = _energy_slope(y, energy, 0.0, 1.0, True, m, L0)
+        s2 = _energy_slope(y + step / 2, energy + step / 2 * s1, 0.0, 1.0, True, m, L0)
+        s3 = _energy_slope(y + step / 2, energy + step / 2 * s2, 0.0, 1.0, True, m, L0)
+        s4 = _energy_slope(y + step, energy + step * s3, 0.0, 1.0, True, m, L0)
+        energy += step / 6 * (s1 + 2 * s2 + 2 * s3 + s4)
+        y += step
+    return energy, 4 * n_steps
+
+
+def simulate_first_drop_energy(k1, k2, with_air_resistance=False, m=bd.m, L0=bd.L0, H=bd.H,
+                               dy=DY, return_evaluations=False):
+    """
+    Alternativa a punto_6y7.simulate_first_drop que acepta arrays de k1 y
+    k2 (con broadcasting). Retorna arrays (y_max, a_at_ymax); si
+    return_evaluations, también la cantidad de evaluaciones de dE/dy por
+    candidato.
+    """
+    k1, k2 = np.broadcast_arrays(np.asarray(k1, dtype=float), np.asarray(k2, dtype=float))
+    m, L0, H = float(m), float(L0), float(H)
+    shape = k1.shape
+    k1, k2 = k1.ravel(), k2.ravel()
+
+    energy_l0, evaluations = _free_fall_energy(with_air_resistance, dy, m, L0)
+
+    def slope(y, energy, index):
+        return _energy_slope(y, energy, k1[index], k2[index], with_air_resistance, m, L0)
+
+    y = np.full(k1.shape, float(L0))
+    energy = np.full(k1.shape, energy_l0)
+    step = np.full(k1.shape, float(dy))
+    y_max = np.full(k1.shape, np.nan)
+    evaluations = np.full(k1.shape, evaluations)
+    active = np.arange(k1.size)
+
+    # Tramo con la cuerda tensa: RK4 en y mientras E siga siendo positiva
+    while active.size:
+        y_a, e_a, h = y[active], energy[active], step[active]
+        s1 = slope(y_a, e_a, active)
+        s2 = slope(y_a + h / 2, e_a + h / 2 * s1, active)
+        s3 = slope(y_a + h / 2, e_a + h / 2 * s2, active)
+        s4 = slope(y_a + h, e_a + h * s3, active)
+        e_next = e_a + h / 6 * (s1 + 2 * s2 + 2 * s3 + s4)
+        evaluations[active] += 4
+
+        # El punto de retorno está dentro del paso si E (o alguna etapa
+        # intermedia) llega a cero
+        crossing = (e_next <= 0) | (e_a + h / 2 * s1 <= 0) | (e_a + h / 2 * s2 <= 0) | (e_a + h * s3 <= 0)
+        # y(E) solo está bien condicionada si E ya viene bajando lo bastante
+        # rápido como para anularse dentro del paso; si no (cuerdas muy
+        # rígidas) se achica el paso y se repite
+        turning = crossing & (s1 < 0) & (e_a <= -s1 * h)
+        # Si dE/dy cambia mucho dentro del paso (cuerdas muy rígidas) también
+        # se achica, para no perder precisión en y_max ni en a
+        steep = ~crossing & (np.abs(s4 - s1) > SLOPE_CHANGE * (np.abs(s1) + bd.g))
+        refine = (crossing & ~turning) | steep
+        step[active[refine]] = h[refine] / 4
+
+        # Condición de seguridad para evitar bucles infinitos si k1 es muy bajo
+        too_deep = ~crossing & ~steep & (y_a + h > H + 10)
+        y_max[active[too_deep]] = y_a[too_deep] + h[too_deep]
+
+        advance = ~crossing & ~steep & ~too_deep
+        y[active[advance]] = y_a[advance] + h[advance]
+        energy[active[advance]] = e_next[advance]
+
+        # Último tramo: se integra y(E) desde el E actual hasta 0
+        index = active[turning]
+        if index.size:
+            y_t, e_t = y[index], energy[index]
+            de = -e_t / ROOT_SUBSTEPS
+            for _ in range(ROOT_SUBSTEPS):
+                r1 = 1.0 / slope(y_t, e_t, index)
+                r2 = 1.0 / slope(y_t + de / 2 * r1, e_t + de / 2, index)
+                r3 = 1.0 / slope(y_t + de / 2 * r2, e_t + de / 2, index)
+                r4 = 1.0 / slope(y_t + de * r3, e_t + de, index)
+                y_t = y_t + de / 6 * (r1 + 2 * r2 + 2 * r3 + r4)
+                e_t = e_t + de
+            y_max[index] = y_t
+            evaluations[index] += 4 * ROOT_SUBSTEPS
+
+        active = active[advance | refine]
+
+    # En el punto más bajo v = 0: solo actúan el peso y la cuerda
+    a_at_ymax = bd.g - k1 * np.maximum(y_max - L0, 0.0) ** k2 / m
+
+    result = (y_max.reshape(shape), a_at_ymax.reshape(shape))
+    if return_evaluations:
+        return result + (evaluations.reshape(shape),)
+    return result
+
+
+# EJECUCIÓN PRINCIPAL
+if __name__ == "__main__":
+    k1_values = np.array([8.5, 12.25, 13.0, 7.0, 1.0, 0.5])
+    k2_values = np.array([1.25, 1.0, 1.17, 1.17, 3.0, 20.0])
+
+    for air in (False, True):
+        print(f"Resistencia del aire: {'Sí' if air else 'No'}")
+        y_e, a_e, evals = simulate_first_drop_energy(k1_values, k2_values, air, return_evaluations=True)
+        for k1_val, k2_val, y_val, a_val, n_eval in zip(k1_values, k2_values, y_e, a_e, evals):
+            y_ref, a_ref = bd.simulate_first_drop(k1_val, k2_val, air, h=1e-4)
+            print(f"  k1={k1_val:6.2f}, k2={k2_val:5.2f}: y_max={y_val:.4f} m (ref {y_ref:.4f}), "
+                  f"a={a_val:.2f} (ref {a_ref:.2f}), {n_eval} evaluaciones")
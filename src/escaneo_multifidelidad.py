@@ -0,0 +1,170 @@
+import time
+
+import numpy as np
+import punto_6y7 as bd
+from integrador_adaptativo import hermite_maximum
+
+# ESCANEO MULTI-FIDELIDAD DEL ESPACIO DE PARÁMETROS
+# 1. Pasada barata: cada candidato se simula con RK4 de paso grueso (h y 2h)
+#    y se estima el error por extrapolación de Richardson.
+# 2. Solo los candidatos cuyo margen a alguna condición es menor que ese
+#    error se vuelven a simular con simulate_first_drop (h = 0.01).
+# Los veredictos finales son los mismos que los de un escaneo completo.
+
+H_COARSE = 0.1
+H_FULL = 0.01
+SAFETY = 4.0
+
+
+def get_jacobian(y, v, k1, k2, with_air_resistance, m=bd.m, L0=bd.L0):
+    """
+    Jacobiano analítico de f(y, v) = [v, a(y, v)].
+    """
+    da_dy = 0.0
+    if y > L0:
+        da_dy = -k1 * k2 * (y - L0) ** (k2 - 1) / m
+
+    da_dv = 0.0
+    if with_air_resistance:
+        da_dv = -bd.c1 * bd.c2 * abs(v) ** (bd.c2 - 1) / m
+
+    return np.array([[0.0, 1.0],
+                     [da_dy, da_dv]])
+
+
+def coarse_first_drop(k1, k2, with_air_resistance, h):
+    """
+    Primera caída con RK4 de paso h. El punto más bajo se ubica entre pasos
+    con el interpolante de Hermite, así el resultado no depende de dónde
+    caen las muestras. Retorna (y_max, a_at_ymax, llego_al_corte).
+    """
+    def state_derivative(current_state):
+        y, v = current_state
+        return np.array([v, bd.get_acceleration(y, v, k1, k2, with_air_resistance)])
+
+    state = np.array([0.0, 0.0])  # [y, v]
+    while True:
+        k1_v = h * state_derivative(state)
+        k2_v = h * state_derivative(state + 0.5 * k1_v)
+        k3_v = h * state_derivative(state + 0.5 * k2_v)
+        k4_v = h * state_derivative(state + k3_v)
+        new_state = state + (k1_v + 2 * k2_v + 2 * k3_v + k4_v) / 6.0
+
+        if new_state[1] < 0:
+            y_max = hermite_maximum(state, new_state, h)
+            return y_max, bd.get_acceleration(y_max, 0.0, k1, k2, with_air_resistance), False
+
+        state = new_state
+        # Misma condición de seguridad que simulate_first_drop
+        if state[0] > bd.H + 10:
+            return state[0], bd.get_acceleration(state[0], state[1], k1, k2, with_air_resistance), True
+
+
+def classify(y_max, a_max):
+    """Veredicto de las dos condiciones del problema."""
+    condicion_altura = bd.Y_MIN_TARGET < y_max < bd.Y_MAX_TARGET
+    condicion_aceleracion = abs(a_max) < bd.A_MAX_LIMIT
+    return condicion_altura, condicion_aceleracion
+
+
+def estimate_coarse(k1, k2, with_air_resistance, h=H_COARSE, safety=SAFETY):
+    """
+    Pasada gruesa de un candidato con su cota de error.
+    Retorna (y_max, a_max, err_y, err_a, llego_al_corte).
+    """
+    y_h, a_h, cut_h = coarse_first_drop(k1, k2, with_air_resistance, h)
+    y_2h, a_2h, cut_2h = coarse_first_drop(k1, k2, with_air_resistance, 2 * h)
+
+    if cut_h and cut_2h:
+        # Ambas pasaron el corte: la profundidad real es todavía mayor
+        return y_h, a_h, 0.0, np.inf, True
+
+    # Richardson para RK4 (orden 4)
+    err_y = safety * abs(y_h - y_2h) / 15.0
+    err_a = safety * abs(a_h - a_2h) / 15.0
+
+    # La referencia toma el máximo entre muestras separadas H_FULL, no el
+    # extremo exacto: ahí v <= |a| h y y queda por debajo hasta |a| h^2 / 2
+    v_sample = abs(a_h) * H_FULL
+    err_y += abs(a_h) * H_FULL ** 2 / 2
+    jacobian = get_jacobian(y_h, v_sample, k1, k2, with_air_resistance)
+    err_a += abs(jacobian[1, 0]) * abs(a_h) * H_FULL ** 2 / 2
+    if with_air_resistance:
+        err_a += bd.c1 * v_sample ** bd.c2 / bd.m
+
+    return y_h, a_h, err_y, err_a, False
+
+
+def is_uncertain(y_max, a_max, err_y, err_a):
+    """
+    True si el error estimado no alcanza para decidir el veredicto.
+    Si una condición falla con certeza, la otra no importa.
+    """
+    altura_dudosa = (abs(y_max - bd.Y_MIN_TARGET) <= err_y
+                     or abs(y_max - bd.Y_MAX_TARGET) <= err_y)
+    aceleracion_dudosa = abs(abs(a_max) - bd.A_MAX_LIMIT) <= err_a
+
+    condicion_altura, condicion_aceleracion = classify(y_max, a_max)
+    if not altura_dudosa and not condicion_altura:
+        return False
+    if not aceleracion_dudosa and not condicion_aceleracion:
+        return False
+    return altura_dudosa or aceleracion_dudosa
+
+
+def scan_multifidelity(k1_range, k2_range, with_air_resistance, h_coarse=H_COARSE, safety=SAFETY):
+    """
+    Escanea la grilla (k1, k2) y devuelve las soluciones válidas con el
+    mismo formato que scan_parameter_space de grafico_punto_6/7, más un
+    dict con la cantidad de candidatos re-simulados.
+    """
+    valid_solutions = []
+    refined = 0
+
+    for k2_val in k2_range:
+        for k1_val in k1_range:
+            y_max, a_max, err_y, err_a, _cut = estimate_coarse(
+                k1_val, k2_val, with_air_resistance, h_coarse, safety)
+
+            if is_uncertain(y_max, a_max, err_y, err_a):
+                refined += 1
+                y_max, a_max = bd.simulate_first_drop(k1_val, k2_val, with_air_resistance)
+
+            condicion_altura, condicion_aceleracion = classify(y_max, a_max)
+            if condicion_altura and condicion_aceleracion:
+                valid_solutions.append({
+                    'k1': k1_val,
+                    'k2': k2_val,
+                    'y_max': y_max,
+                    'a_max': a_max
+                })
+
+    total = len(k1_range) * len(k2_range)
+    return valid_solutions, {'total': total, 'refined': refined}
+
+
+# EJECUCIÓN PRINCIPAL
+if __name__ == "__main__":
+    k1_range = np.arange(0.5, 20, 0.5)
+    k2_range = np.arange(1, 2, 0.05)
+
+    for air in (False, True):
+        print(f"Resistencia del aire: {'Sí' if air else 'No'}")
+
+        start = time.perf_counter()
+        solutions, stats = scan_multifidelity(k1_range, k2_range, air)
+        time_multi = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = []
+        for k2_val in k2_range:
+            for k1_val in k1_range:
+                y_max, a_max = bd.simulate_first_drop(k1_val, k2_val, air)
+                if all(classify(y_max, a_max)):
+                    reference.append((k1_val, k2_val))
+        time_full = time.perf_counter() - start
+
+        same = [(s['k1'], s['k2']) for s in solutions] == reference
+        print(f"  Multi-fidelidad: {time_multi:.1f} s, {stats['refined']} de {stats['total']} re-simulados")
+        print(f"  Escaneo completo: {time_full:.1f} s")
+        print(f"  Soluciones válidas: {len(reference)} | Veredictos idénticos: {'Sí' if same else 'No'}")
@@ -0,0 +1,150 @@
+import numpy as np
+import punto_6y7 as bd
+
+# INTEGRADOR DE PASO ADAPTATIVO PARA LA PRIMERA CAÍDA
+#
+# Para k2 grande la fuerza k1 (y - L0)^k2 crece muy rápido cerca del punto
+# más bajo: RK4 con h fijo pierde precisión y el resultado pasa a depender
+# del corte H + 10. Aquí se usa RK4 con paso adaptativo (duplicación de
+# paso), que achica h solo en ese tramo.
+#
+# La "rigidez" de este problema es oscilatoria: los autovalores del
+# jacobiano son +-i*sqrt(k1 k2 (y - L0)^(k2-1) / m) (más una parte real
+# chica con aire) y la solución misma oscila a esa frecuencia, así que el
+# paso lo limita la precisión y no la estabilidad. Un método implícito no
+# permite pasos más largos; por eso no se usa uno.
+
+
+def simulate_first_drop_adaptive(k1, k2, with_air_resistance=False, m=bd.m, L0=bd.L0, H=bd.H,
+                                 rtol=1e-6, atol=1e-6, h0=0.01, h_max=0.5, return_stats=False):
+    """
+    Simula la primera caída con RK4 de paso adaptativo. El error local se
+    estima por duplicación de paso. Retorna (y_max, a_at_ymax) y, si
+    return_stats, un dict con la cantidad de pasos aceptados y rechazados.
+    """
+    def derivative(current_state):
+        y, v = current_state
+        return np.array([v, bd.get_acceleration(y, v, k1, k2, with_air_resistance, m, L0)])
+
+    def rk4_step(current_state, h):
+        k1_v = h * derivative(current_state)
+        k2_v = h * derivative(current_state + 0.5 * k1_v)
+        k3_v = h * derivative(current_state + 0.5 * k2_v)
+        k4_v = h * derivative(current_state + k3_v)
+        return current_state + (k1_v + 2 * k2_v + 2 * k3_v + k4_v) / 6.0
+
+    state = np.array([0.0, 0.0])  # [y, v]
+    h = h0
+    y_max = 0.0
+    a_at_ymax = 0.0
+    y_limit = H + 10
+    stats = {'accepted': 0, 'rejected': 0}
+
+    while True:
+        full = rk4_step(state, h)
+        half = rk4_step(rk4_step(state, 0.5 * h), 0.5 * h)
+        scale = atol + rtol * np.abs(state)
+        error = np.max(np.abs(half - full) / scale) / 15.0
+
+        if error > 1.0:
+            stats['rejected'] += 1
+            h *= max(0.2, 0.9 * error ** (-0.2))
+            continue
+
+        stats['accepted'] += 1
+        new_state = half
+
+        # Máximo de y dentro del paso: si la velocidad cambió de signo se
+        # ubica con el interpolante cúbico de Hermite
+        turned = new_state[1] < 0
+        peak = hermite_maximum(state, new_state, h) if turned else new_state[0]
+
+        if peak > y_limit:
+            # Condición de seguridad para evitar bucles infinitos si k1 es
+            # muy bajo. Con pasos largos no se sigue de largo: el corte se
+            # ubica dentro del paso con el mismo interpolante
+            y_max, v_limit = hermite_crossing(state, new_state, h, y_limit)
+            a_at_ymax = bd.get_acceleration(y_max, v_limit, k1, k2, with_air_resistance, m, L0)
+            break
+
+        if turned:
+            y_max = max(y_max, peak)
+            a_at_ymax = bd.get_acceleration(y_max, 0.0, k1, k2, with_air_resistance, m, L0)
+            break
+
+        state = new_state
+        y_max = state[0]
+        a_at_ymax = bd.get_acceleration(state[0], state[1], k1, k2, with_air_resistance, m, L0)
+
+        h = min(h_max, h * min(4.0, 0.9 * max(error, 1e-10) ** (-0.2)))
+
+    if return_stats:
+        return y_max, a_at_ymax, stats
+    return y_max, a_at_ymax
+
+
+def _hermite_coefficients(state0, state1, h):
+    """y(s) = y0 + h*v0*s + c2*s^2 + c3*s^3, con s en [0, 1]."""
+    y0, v0 = state0
+    y1, v1 = state1
+    c2 = 3 * (y1 - y0) - h * (2 * v0 + v1)
+    c3 = -2 * (y1 - y0) + h * (v0 + v1)
+    return y0, h * v0, c2, c3
+
+
+def _hermite_argmax(state0, state1, h):
+    """Valor de s en [0, 1] donde el interpolante de Hermite es máximo."""
+    y0, b, c2, c3 = _hermite_coefficients(state0, state1, h)
+    # Raíces de y'(s) = b + 2*c2*s + 3*c3*s^2
+    candidates = [0.0, 1.0]
+    if abs(c3) > 1e-14:
+        disc = 4 * c2 * c2 - 12 * c3 * b
+        if disc >= 0:
+            root = np.sqrt(disc)
+            candidates += [(-2 * c2 + root) / (6 * c3), (-2 * c2 - root) / (6 * c3)]
+    elif abs(c2) > 1e-14:
+        candidates.append(-b / (2 * c2))
+    return max((s for s in candidates if 0.0 <= s <= 1.0),
+               key=lambda s: y0 + b * s + c2 * s * s + c3 * s ** 3)
+
+
+def hermite_maximum(state0, state1, h):
+    """
+    Máximo de y en un paso de longitud h según el interpolante cúbico de
+    Hermite construido con (y, v) en los dos extremos.
+    """
+    y0, b, c2, c3 = _hermite_coefficients(state0, state1, h)
+    s = _hermite_argmax(state0, state1, h)
+    return y0 + b * s + c2 * s * s + c3 * s ** 3
+
+
+def hermite_crossing(state0, state1, h, y_target):
+    """
+    Estado (y, v) donde el interpolante de Hermite del paso alcanza
+    y_target por primera vez (se supone y0 < y_target <= máximo del paso).
+    """
+    y0, b, c2, c3 = _hermite_coefficients(state0, state1, h)
+    # Bisección entre el inicio del paso y el máximo del interpolante
+    low, high = 0.0, _hermite_argmax(state0, state1, h)
+    for _ in range(60):
+        mid = 0.5 * (low + high)
+        if y0 + b * mid + c2 * mid * mid + c3 * mid ** 3 < y_target:
+            low = mid
+        else:
+            high = mid
+    s = 0.5 * (low + high)
+    return y_target, (b + 2 * c2 * s + 3 * c3 * s * s) / h
+
+
+# EJECUCIÓN PRINCIPAL
+if __name__ == "__main__":
+    print("Comparación RK4 (h=0.01), RK4 de referencia (h=1e-4) y paso adaptativo")
+    for k1_val, k2_val in [(8.5, 1.25), (1.0, 3.0), (0.01, 8.0), (0.5, 20.0)]:
+        y_rk4, a_rk4 = bd.simulate_first_drop(k1_val, k2_val, h=0.01)
+        y_ref, a_ref = bd.simulate_first_drop(k1_val, k2_val, h=1e-4)
+        y_ad, a_ad, stats = simulate_first_drop_adaptive(k1_val, k2_val, return_stats=True)
+        print(f"  k1={k1_val}, k2={k2_val}:")
+        print(f"    RK4 h=0.01   y_max={y_rk4:.4f} m, a={a_rk4:.2f} m/s^2")
+        print(f"    Referencia   y_max={y_ref:.4f} m, a={a_ref:.2f} m/s^2")
+        print(f"    Adaptativo   y_max={y_ad:.4f} m, a={a_ad:.2f} m/s^2 "
+              f"({stats['accepted']} pasos, {stats['rejected']} rechazados)")
@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from constantes import L0, g, k1, k2, m
+from trayectoria import integrate_rk4
 
 # DEFINICIÓN DE LA FÍSICA
 def get_acceleration(y):
@@ -88,10 +89,11 @@ if __name__ == "__main__":
     print("Ejecutando simulación de Runge-Kutta 4...")
     data_rk4 = simulate_rk4(H_RK4, T_MAX)
 
-    # Se genera una solución de referencia con RK4 y un paso muy pequeño
-    # para simular la "solución analítica" en el tiempo.
+    # Se genera una solución de referencia con RK4 (h=0.01) y se la muestrea
+    # cada 0.001 s con salida densa para simular la "solución analítica".
     print("Ejecutando simulación de referencia (RK4 alta precisión)...")
-    data_ref = simulate_rk4(0.001, T_MAX)
+    trajectory_ref = integrate_rk4(lambda y, _v: get_acceleration(y), 0.01, T_MAX)
+    data_ref = trajectory_ref.sample(0.001)
 
     # Conversión de unidades para los gráficos
     # Velocidad: m/s -> km/h (multiplicar por 3.6)
@@ -108,7 +110,7 @@ if __name__ == "__main__":
     fig.suptitle('Análisis Comparativo de Métodos Numéricos - Bungee Jumping', fontsize=16)
 
     # 1. Gráfico de Posición
-    axes[0].plot(data_ref['t'], data_ref['y'], 'k--', label='Referencia (RK4 h=0.001s)')
+    axes[0].plot(data_ref['t'], data_ref['y'], 'k--', label='Referencia (RK4 h=0.01s, salida densa)')
     axes[0].plot(data_euler['t'], data_euler['y'], label=f'Euler (h={H_EULER}s)')
     axes[0].plot(data_rk4['t'], data_rk4['y'], ':', label=f'RK4 (h={H_RK4}s)')
     axes[0].axhline(y=L0, color='r', linestyle='-.', label=f'L0 = {L0:.1f} m')
@@ -119,7 +121,7 @@ if __name__ == "__main__":
     axes[0].legend()
 
     # 2. Gráfico de Velocidad
-    axes[1].plot(data_ref['t'], data_ref['v'], 'k--', label='Referencia (RK4 h=0.001s)')
+    axes[1].plot(data_ref['t'], data_ref['v'], 'k--', label='Referencia (RK4 h=0.01s, salida densa)')
     axes[1].plot(data_euler['t'], data_euler['v'], label=f'Euler (h={H_EULER}s)')
     axes[1].plot(data_rk4['t'], data_rk4['v'], ':', label=f'RK4 (h={H_RK4}s)')
     axes[1].set_ylabel('Velocidad [km/h]')
@@ -128,7 +130,7 @@ if __name__ == "__main__":
     axes[1].legend()
 
     # 3. Gráfico de Aceleración
-    axes[2].plot(data_ref['t'], data_ref['a'], 'k--', label='Referencia (RK4 h=0.001s)')
+    axes[2].plot(data_ref['t'], data_ref['a'], 'k--', label='Referencia (RK4 h=0.01s, salida densa)')
     axes[2].plot(data_euler['t'], data_euler['a'], label=f'Euler (h={H_EULER}s)')
     axes[2].plot(data_rk4['t'], data_rk4['a'], ':', label=f'RK4 (h={H_RK4}s)')
     axes[2].set_xlabel('Tiempo [s]')
@@ -19,10 +19,11 @@ A_MAX_LIMIT = 2.5 * g   # Aceleración máxima permitida (24.525 m/s^2)
 
 # MOTOR DE SIMULACIÓN (RK4)
 
-def get_acceleration(y, v, k1, k2, with_air_resistance):
+def get_acceleration(y, v, k1, k2, with_air_resistance, m=m, L0=L0):
     """
     Calcula la aceleración para un estado (y, v) y parámetros de cuerda
     dados. Puede incluir o no la resistencia del aire.
+    La masa y la longitud natural por defecto son las del problema.
     """
     # Fuerza elástica (solo si la cuerda está tensa)
     f_elastica = 0.0
@@ -41,12 +42,14 @@ def get_acceleration(y, v, k1, k2, with_air_resistance):
     return f_neta / m
 
 
-def simulate_first_drop(k1, k2, with_air_resistance=False):
+def simulate_first_drop(k1, k2, with_air_resistance=False, m=m, L0=L0, H=H, h=0.01):
     """
-    Simula solo la primera caída usando RK4.
+    Simula solo la primera caída usando RK4 con paso h (por defecto un
+    paso pequeño para una simulación precisa).
     Retorna la profundidad máxima (y_max) y la aceleración en ese punto.
+    Por defecto se usan m, L0 y H del problema; pueden cambiarse para
+    evaluar otros saltadores o sitios de salto.
     """
-    h = 0.01  # Paso de tiempo pequeño para una simulación precisa
     state = np.array([0.0, 0.0])  # [y, v]
 
     y_max = 0.0
@@ -54,7 +57,7 @@ def simulate_first_drop(k1, k2, with_air_resistance=False):
 
     def state_derivative(current_state):
         y, v = current_state
-        a = get_acceleration(y, v, k1, k2, with_air_resistance)
+        a = get_acceleration(y, v, k1, k2, with_air_resistance, m, L0)
         return np.array([v, a])
 
     # Simular solo hasta que la velocidad se haga negativa (fin de la 1ra caída)
@@ -68,7 +71,7 @@ def simulate_first_drop(k1, k2, with_air_resistance=False):
         if state[0] > y_max:
             y_max = state[0]
             # Guardamos la aceleración en el punto más bajo
-            a_at_ymax = get_acceleration(state[0], state[1], k1, k2, with_air_resistance)
+            a_at_ymax = get_acceleration(state[0], state[1], k1, k2, with_air_resistance, m, L0)
         
         # Condición de seguridad para evitar bucles infinitos si k1 es muy bajo
         if y_max > H + 10:
@@ -108,29 +111,36 @@ def find_optimal_params(with_air_resistance):
     return None, None, None, None
 
 
-# EJECUCIÓN PRINCIPAL
-if __name__ == "__main__":
+def report_optimal_params(with_air_resistance):
+    """
+    Busca los parámetros óptimos e imprime el informe del Punto 6 (sin
+    aire) o del Punto 7 (con aire). Retorna lo mismo que find_optimal_params.
+    """
+    if with_air_resistance:
+        punto, titulo, etiqueta = 7, "CON", "Con Aire"
+    else:
+        punto, titulo, etiqueta = 6, "SIN", "Sin Aire"
+
     print("==================================================")
-    print("PUNTO 6: Dimensionamiento SIN Resistencia del Aire")
+    print(f"PUNTO {punto}: Dimensionamiento {titulo} Resistencia del Aire")
     print("==================================================")
-    k1_s6, k2_s6, y_max_s6, a_max_s6 = find_optimal_params(with_air_resistance=False)
+    k1_val, k2_val, y_max, a_max = find_optimal_params(with_air_resistance)
 
-    if k1_s6:
-        print("\n--- Resultados (Sin Aire) ---")
-        print(f"Parámetros encontrados: k1 = {k1_s6:.4f}, k2 = {k2_s6:.2f}")
-        print(f"Profundidad máxima:     y_max = {y_max_s6:.2f} m")
-        print(f"Aceleración en y_max:   a_max = {a_max_s6:.2f} m/s^2 ({abs(a_max_s6/g):.2f} g)")
+    if k1_val:
+        print(f"\n--- Resultados ({etiqueta}) ---")
+        print(f"Parámetros encontrados: k1 = {k1_val:.4f}, k2 = {k2_val:.2f}")
+        print(f"Profundidad máxima:     y_max = {y_max:.2f} m")
+        print(f"Aceleración en y_max:   a_max = {a_max:.2f} m/s^2 ({abs(a_max/g):.2f} g)")
 
-    print("\n==================================================")
-    print("PUNTO 7: Dimensionamiento CON Resistencia del Aire")
-    print("==================================================")
-    k1_s7, k2_s7, y_max_s7, a_max_s7 = find_optimal_params(with_air_resistance=True)
+    return k1_val, k2_val, y_max, a_max
+
+
+# EJECUCIÓN PRINCIPAL
+if __name__ == "__main__":
+    k1_s6, k2_s6, y_max_s6, a_max_s6 = report_optimal_params(with_air_resistance=False)
 
-    if k1_s7:
-        print("\n--- Resultados (Con Aire) ---")
-        print(f"Parámetros encontrados: k1 = {k1_s7:.4f}, k2 = {k2_s7:.2f}")
-        print(f"Profundidad máxima:     y_max = {y_max_s7:.2f} m")
-        print(f"Aceleración en y_max:   a_max = {a_max_s7:.2f} m/s^2 ({abs(a_max_s7/g):.2f} g)")
+    print()
+    k1_s7, k2_s7, y_max_s7, a_max_s7 = report_optimal_params(with_air_resistance=True)
 
     print("\n\n--- COMPARACIÓN Y ANÁLISIS ---")
     if k1_s6 and k1_s7:
@@ -139,4 +149,4 @@ if __name__ == "__main__":
               "Esto significa que, para una misma cuerda, el saltador no caerá tan profundo.")
         print("Para compensar esta pérdida de energía y alcanzar la misma "
               "profundidad objetivo, se necesita una cuerda 'más blanda', "
-              "es decir, con una constante elástica k1 menor.")
\ No newline at end of file
+              "es decir, con una constante elástica k1 menor.")
@@ -0,0 +1,301 @@
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+import punto_6y7 as bd
+from energia_posicion import simulate_first_drop_energy
+from escaneo_multifidelidad import coarse_first_drop
+from integrador_adaptativo import simulate_first_drop_adaptive
+
+# SELECCIÓN AUTOMÁTICA DEL MÉTODO SEGÚN LA PRECISIÓN PEDIDA
+# En lugar de fijar método y paso, se pide una precisión para y_max y para
+# la aceleración en y_max. Para el escenario actual (con o sin aire y
+# rangos de k1, k2) se calibra cada método sobre una grilla de cuerdas de
+# prueba que cubre todo el rango, se ajusta un modelo error ~ C * p^q y
+# costo ~ K * p^r en función de su parámetro p (paso o tolerancia) y se
+# propone el más barato que cumple.
+#
+# La propuesta se verifica en otra grilla de cuerdas (los centros de las
+# celdas de la de calibración). Si alguna se pasa de la precisión pedida,
+# se achica p y, si no alcanza, se pasa al método siguiente. Lo que queda
+# garantizado es que el método elegido cumple en todas las cuerdas de
+# calibración y de verificación; entre ellas es una extrapolación.
+# Calibraciones y elecciones quedan guardadas en un archivo de caché.
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_selector.json')
+SAFETY = 2.0  # El error predicho debe quedar por debajo de target / SAFETY
+REFERENCE_TOL = 1e-11
+CACHE_VERSION = 2
+TIGHTEN_STEPS = 3  # Veces que se divide p por 2 si la verificación falla
+
+
+def euler_first_drop(k1, k2, with_air_resistance, h):
+    """Primera caída con Euler (como solve_euler del Punto 3, para cualquier cuerda)."""
+    y, v = 0.0, 0.0
+    y_max, a_at_ymax = 0.0, 0.0
+    while v >= 0:
+        a = bd.get_acceleration(y, v, k1, k2, with_air_resistance)
+        y = y + h * v
+        v = v + h * a
+        if y > y_max:
+            y_max = y
+            a_at_ymax = bd.get_acceleration(y, v, k1, k2, with_air_resistance)
+        # Condición de seguridad para evitar bucles infinitos si k1 es muy bajo
+        if y_max > bd.H + 10:
+            break
+    return y_max, a_at_ymax
+
+
+# Método -> (función(k1, k2, aire, p), valores de p para calibrar).
+# Para todos, un p más chico es más preciso y más caro.
+BACKENDS = {
+    'euler': (euler_first_drop, [0.01, 0.005, 0.0025]),
+    'rk4': (lambda k1, k2, air, h: bd.simulate_first_drop(k1, k2, air, h=h),
+            [0.2, 0.1, 0.05, 0.02, 0.01]),
+    'rk4_hermite': (lambda k1, k2, air, h: coarse_first_drop(k1, k2, air, h)[:2],
+                    [0.4, 0.2, 0.1, 0.05, 0.02]),
+    'adaptativo': (lambda k1, k2, air, tol: simulate_first_drop_adaptive(k1, k2, air, rtol=tol, atol=tol),
+                   [1e-2, 1e-4, 1e-6, 1e-8]),
+    'energia': (lambda k1, k2, air, dy: simulate_first_drop_energy(k1, k2, air, dy=dy),
+                [2.0, 1.0, 0.5, 0.25, 0.1]),
+}
+
+
+def _reference(k1, k2, with_air_resistance):
+    return simulate_first_drop_adaptive(k1, k2, with_air_resistance, rtol=REFERENCE_TOL, atol=REFERENCE_TOL)
+
+
+def _reference_cords(k1_values, k2_values, with_air_resistance):
+    """
+    Referencias en la grilla k1 x k2. Se descartan las cuerdas que llegan
+    al corte H + 10 (ahí la profundidad no está definida y no sirven para
+    medir el error).
+    """
+    cords = []
+    for k2_val in k2_values:
+        for k1_val in k1_values:
+            y_ref, a_ref = _reference(k1_val, k2_val, with_air_resistance)
+            if y_ref < bd.H + 10:
+                cords.append((float(k1_val), float(k2_val), float(y_ref), float(a_ref)))
+    return cords
+
+
+def _max_errors(solver, p, cords, with_air_resistance):
+    """Error máximo en y_max y en a_at_ymax sobre un conjunto de cuerdas."""
+    err_y, err_a = 0.0, 0.0
+    for k1_val, k2_val, y_ref, a_ref in cords:
+        y_max, a_max = solver(k1_val, k2_val, with_air_resistance, p)
+        err_y = max(err_y, abs(float(y_max) - y_ref))
+        err_a = max(err_a, abs(float(a_max) - a_ref))
+    return err_y, err_a
+
+
+def _fit_power_law(params, values):
+    """Ajuste log(values) = log(C) + q log(params). Retorna (log C, q)."""
+    values = np.maximum(np.asarray(values, dtype=float), 1e-14)
+    q, log_c = np.polyfit(np.log(params), np.log(values), 1)
+    return log_c, q
+
+
+class SolverSelector:
+    """
+    Calibra los métodos disponibles para un escenario y elige, para una
+    precisión pedida, el más barato que la cumple.
+    """
+
+    def __init__(self, with_air_resistance=False, k1_range=(0.5, 20.0), k2_range=(0.5, 3.0),
+                 n_probes=5, cache_path=CACHE_PATH):
+        self.with_air_resistance = with_air_resistance
+        self.k1_range = tuple(float(x) for x in k1_range)
+        self.k2_range = tuple(float(x) for x in k2_range)
+        self.n_probes = n_probes
+        self.cache_path = cache_path
+        self.models = None
+        self.choices = {}
+        self._probes = None
+        self._holdout = None
+
+    @property
+    def scenario_key(self):
+        """Identifica el escenario (física y rangos) en la caché."""
+        scenario = [CACHE_VERSION, self.with_air_resistance, self.k1_range, self.k2_range, self.n_probes,
+                    bd.m, bd.L0, bd.H, bd.g, bd.c1, bd.c2, sorted(BACKENDS)]
+        return hashlib.sha256(json.dumps(scenario).encode()).hexdigest()[:16]
+
+    def probes(self):
+        """Cuerdas de calibración: grilla de n_probes x n_probes en los rangos."""
+        if self._probes is None:
+            k1_values = np.linspace(*self.k1_range, self.n_probes)
+            k2_values = np.linspace(*self.k2_range, self.n_probes)
+            probes = _reference_cords(k1_values, k2_values, self.with_air_resistance)
+            if not probes:
+                raise ValueError("Ningún candidato de prueba termina la primera caída dentro de H + 10")
+            self._probes = probes
+        return self._probes
+
+    def holdout(self):
+        """
+        Cuerdas de verificación: los centros de las celdas de la grilla de
+        calibración (ninguna coincide con una cuerda de calibración).
+        """
+        if self._holdout is None:
+            k1_values = np.linspace(*self.k1_range, self.n_probes)
+            k2_values = np.linspace(*self.k2_range, self.n_probes)
+            self._holdout = _reference_cords((k1_values[:-1] + k1_values[1:]) / 2,
+                                             (k2_values[:-1] + k2_values[1:]) / 2,
+                                             self.with_air_resistance)
+        return self._holdout
+
+    def _load_cache(self):
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path) as file:
+                return json.load(file)
+        return {}
+
+    def _save_cache(self):
+        cache = self._load_cache()
+        cache[self.scenario_key] = {'models': self.models, 'probes': self._probes,
+                                    'holdout': self._holdout, 'choices': self.choices}
+        with open(self.cache_path, 'w') as file:
+            json.dump(cache, file, indent=2)
+
+    def calibrate(self, force=False):
+        """
+        Mide error y costo de cada método en las cuerdas de calibración y
+        ajusta los modelos. Usa la caché si ya existe una calibración para
+        este escenario.
+        """
+        entry = self._load_cache().get(self.scenario_key)
+        if not force and entry is not None:
+            self.models = entry['models']
+            self._probes = [tuple(cord) for cord in entry['probes']]
+            self._holdout = [tuple(cord) for cord in entry['holdout']]
+            self.choices = entry['choices']
+            return self.models
+
+        print("Calibrando métodos para el escenario actual...")
+        probes = self.probes()
+        models = {}
+        for name, (solver, params) in BACKENDS.items():
+            err_y, err_a, costs = [], [], []
+            for p in params:
+                start = time.perf_counter()
+                errors = _max_errors(solver, p, probes, self.with_air_resistance)
+                costs.append((time.perf_counter() - start) / len(probes))
+                err_y.append(errors[0])
+                err_a.append(errors[1])
+
+            models[name] = {
+                'params': params,
+                'err_y': _fit_power_law(params, err_y),
+                'err_a': _fit_power_law(params, err_a),
+                'cost': _fit_power_law(params, costs),
+                'measured': {'err_y': err_y, 'err_a': err_a, 'cost': costs},
+            }
+            print(f"  {name}: error y_max {min(err_y):.1e}..{max(err_y):.1e} m, "
+                  f"costo {min(costs) * 1e3:.2f}..{max(costs) * 1e3:.2f} ms")
+
+        self.models = models
+        self.choices = {}
+        self.holdout()
+        self._save_cache()
+        return models
+
+    def _predict(self, target_y, target_a):
+        """
+        Propuestas (método, p, costo_predicho) según los modelos, de la más
+        barata a la más cara. Solo se interpola dentro del rango calibrado
+        de cada método.
+        """
+        proposals = []
+        for name, model in self.models.items():
+            params = model['params']
+            p_min, p_max = min(params), max(params)
+
+            # Mayor p que cumple cada precisión según el modelo de error
+            candidates = [p_max]
+            for key, target in (('err_y', target_y), ('err_a', target_a)):
+                log_c, q = model[key]
+                if q <= 0:
+                    # El error no baja al achicar p: solo sirve si ya cumple
+                    fits = np.exp(log_c) * p_min ** q <= target / SAFETY
+                    candidates.append(p_max if fits else 0.0)
+                else:
+                    candidates.append(np.exp((np.log(target / SAFETY) - log_c) / q))
+            p = min(candidates)
+            if p < p_min:
+                continue
+            proposals.append((name, float(p), self._cost(name, p)))
+        return sorted(proposals, key=lambda proposal: proposal[2])
+
+    def _cost(self, name, p):
+        log_k, r = self.models[name]['cost']
+        return float(np.exp(log_k) * p ** r)
+
+    def choose(self, target_y=0.01, target_a=0.01):
+        """
+        Elige (método, parámetro, costo_predicho) para que los errores
+        absolutos en y_max [m] y en la aceleración [m/s^2] queden por
+        debajo de los pedidos en todas las cuerdas de calibración y de
+        verificación. La elección queda en la caché.
+        """
+        if self.models is None:
+            self.calibrate()
+        key = f"{target_y!r},{target_a!r}"
+        if key in self.choices:
+            return tuple(self.choices[key])
+
+        cords = self.probes() + self.holdout()
+        # Propuestas (método, p, costo, veces ajustado) ordenadas por costo:
+        # si una falla, su versión con p / 2 vuelve a la lista según su costo
+        # y compite con las demás en vez de aceptarse apenas cumpla
+        proposals = [(name, p, cost, 0) for name, p, cost in self._predict(target_y, target_a)]
+        while proposals:
+            name, p, cost, tightened = proposals.pop(0)
+            err_y, err_a = _max_errors(BACKENDS[name][0], p, cords, self.with_air_resistance)
+            if err_y <= target_y and err_a <= target_a:
+                self.choices[key] = (name, p, cost)
+                self._save_cache()
+                return self.choices[key]
+            if tightened < TIGHTEN_STEPS:
+                proposals.append((name, p / 2, self._cost(name, p / 2), tightened + 1))
+                proposals.sort(key=lambda proposal: proposal[2])
+
+        raise ValueError(f"Ningún método alcanza y_max ± {target_y} m y a ± {target_a} m/s^2")
+
+    def simulate(self, k1, k2, target_y=0.01, target_a=0.01):
+        """Primera caída de una cuerda con el método más barato que cumple."""
+        name, p, _cost = self.choose(target_y, target_a)
+        y_max, a_max = BACKENDS[name][0](k1, k2, self.with_air_resistance, p)
+        return float(y_max), float(a_max)
+
+    def sweep(self, k1_values, k2_values, target_y=0.01, target_a=0.01):
+        """
+        Barrido sobre arrays de k1 y k2 (con broadcasting). El método se
+        elige una sola vez; el de energía se llama vectorizado.
+        """
+        name, p, _cost = self.choose(target_y, target_a)
+        k1_values, k2_values = np.broadcast_arrays(np.asarray(k1_values, dtype=float),
+                                                   np.asarray(k2_values, dtype=float))
+        if name == 'energia':
+            return simulate_first_drop_energy(k1_values, k2_values, self.with_air_resistance, dy=p)
+
+        solver = BACKENDS[name][0]
+        results = np.array([solver(k1_val, k2_val, self.with_air_resistance, p)
+                            for k1_val, k2_val in zip(k1_values.ravel(), k2_values.ravel())], dtype=float)
+        return results[:, 0].reshape(k1_values.shape), results[:, 1].reshape(k1_values.shape)
+
+
+# EJECUCIÓN PRINCIPAL
+if __name__ == "__main__":
+    for air in (False, True):
+        print(f"\nResistencia del aire: {'Sí' if air else 'No'}")
+        selector = SolverSelector(with_air_resistance=air)
+        selector.calibrate()
+        for target in (1.0, 0.1, 0.01, 1e-4):
+            name, p, cost = selector.choose(target_y=target, target_a=target)
+            y_max, a_max = selector.simulate(8.5, 1.25, target_y=target, target_a=target)
+            print(f"  Precisión {target:g}: {name} (p = {p:.3g}, ~{cost * 1e3:.2f} ms) "
+                  f"-> y_max = {y_max:.4f} m, a = {a_max:.4f} m/s^2")
@@ -0,0 +1,317 @@
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import punto_6y7 as bd
+
+# SERVIDOR LOCAL DE SIMULACIONES
+# Mantiene el intérprete y NumPy cargados para responder consultas de
+# y_max / aceleración sin pagar el arranque de un script por cada pedido.
+#
+# Protocolo: HTTP/1.1 mínimo (TCP o socket Unix), cuerpo JSON.
+#   POST /simulate  {"k1": 8.5, "k2": 1.25, "with_air_resistance": false}
+#   POST /scan      {"k1_range": [0.5, 20, 0.25], "k2_range": [1, 2, 0.01],
+#                    "with_air_resistance": false, "chunk_size": 64}
+#   POST /design    {"with_air_resistance": true}  (mismos rangos que /scan)
+#
+# /scan responde con "Transfer-Encoding: chunked": una línea JSON por cada
+# bloque de candidatos a medida que se termina de calcular.
+
+DEFAULT_CHUNK_SIZE = 64
+MAX_RANGE_VALUES = 10000
+MAX_CANDIDATES = 200000  # Límite de k1 x k2 por pedido
+
+
+# TRABAJOS QUE CORREN EN LOS PROCESOS DEL POOL
+
+def _warm_up():
+    """Ejecuta una simulación corta para dejar el proceso listo."""
+    return bd.simulate_first_drop(bd.L0, 1.0)
+
+
+def _simulate_one(k1, k2, with_air_resistance):
+    y_max, a_max = bd.simulate_first_drop(k1, k2, with_air_resistance)
+    return float(y_max), float(a_max)
+
+
+def _simulate_chunk(candidates, with_air_resistance):
+    """
+    Simula un bloque de candidatos (k1, k2) y devuelve, para cada uno,
+    los resultados y si cumple las condiciones del problema.
+    """
+    results = []
+    for k1_val, k2_val in candidates:
+        y_max, a_max = _simulate_one(k1_val, k2_val, with_air_resistance)
+        condicion_altura = bd.Y_MIN_TARGET < y_max < bd.Y_MAX_TARGET
+        condicion_aceleracion = abs(a_max) < bd.A_MAX_LIMIT
+        results.append({
+            'k1': k1_val,
+            'k2': k2_val,
+            'y_max': y_max,
+            'a_max': a_max,
+            'valid': condicion_altura and condicion_aceleracion,
+        })
+    return results
+
+
+# LÓGICA DEL SERVIDOR
+
+def build_candidates(k1_range, k2_range):
+    """
+    Arma la lista de candidatos en el mismo orden que find_optimal_params
+    (k2 en el bucle externo, k1 en el interno).
+    """
+    k1_values = np.arange(*k1_range)
+    k2_values = np.arange(*k2_range)
+    return [(float(k1_val), float(k2_val)) for k2_val in k2_values for k1_val in k1_values]
+
+
+class SimulationServer:
+    """
+    Recibe trabajos, unifica los pedidos idénticos que están en curso y
+    delega el cálculo a un pool de procesos.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = None
+        # Pedidos en curso: clave canónica -> Future compartido
+        self.in_flight = {}
+        # Cantidad de pedidos que esperan cada Future
+        self.waiters = {}
+
+    async def start_pool(self):
+        loop = asyncio.get_running_loop()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        # Se fuerza el arranque de todos los procesos antes de atender pedidos
+        await asyncio.gather(*[loop.run_in_executor(self.pool, _warm_up)
+                               for _ in range(self.workers)])
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    def submit(self, key, func, *args):
+        """
+        Envía func(*args) al pool. Si ya hay un trabajo en curso con la
+        misma clave, se devuelve el mismo Future en lugar de recalcular.
+        Cada llamada debe cerrarse con release(key).
+        """
+        self.waiters[key] = self.waiters.get(key, 0) + 1
+        future = self.in_flight.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = asyncio.ensure_future(loop.run_in_executor(self.pool, func, *args))
+        self.in_flight[key] = future
+        return future
+
+    def release(self, keys):
+        """
+        Indica que un pedido ya no espera estos trabajos. Los que quedan sin
+        nadie esperando se sacan de la tabla y, si todavía no arrancaron en
+        el pool, se cancelan.
+        """
+        for key in keys:
+            self.waiters[key] -= 1
+            if self.waiters[key] == 0:
+                del self.waiters[key]
+                future = self.in_flight.pop(key)
+                if not future.done():
+                    future.cancel()
+
+    async def simulate(self, k1, k2, with_air_resistance):
+        key = ('simulate', k1, k2, with_air_resistance)
+        try:
+            y_max, a_max = await asyncio.shield(
+                self.submit(key, _simulate_one, k1, k2, with_air_resistance))
+        finally:
+            self.release([key])
+        return {'k1': k1, 'k2': k2, 'y_max': y_max, 'a_max': a_max}
+
+    def scan_chunks(self, candidates, with_air_resistance, chunk_size):
+        """
+        Divide los candidatos en bloques y los envía todos al pool.
+        Devuelve las claves y los Futures en el orden de la grilla.
+        """
+        keys, futures = [], []
+        for start in range(0, len(candidates), chunk_size):
+            chunk = tuple(candidates[start:start + chunk_size])
+            key = ('chunk', chunk, with_air_resistance)
+            keys.append(key)
+            futures.append(self.submit(key, _simulate_chunk, chunk, with_air_resistance))
+        return keys, futures
+
+    async def design(self, candidates, with_air_resistance, chunk_size):
+        """
+        Equivalente a find_optimal_params: devuelve la primera solución
+        válida en el orden de la grilla, pero calculando los bloques en
+        paralelo. Al encontrarla se liberan los bloques restantes.
+        """
+        keys, futures = self.scan_chunks(candidates, with_air_resistance, chunk_size)
+        try:
+            for future in futures:
+                for result in await asyncio.shield(future):
+                    if result['valid']:
+                        return result
+            return None
+        finally:
+            self.release(keys)
+
+
+# CAPA HTTP
+
+def parse_range(value, name):
+    """Valida un rango [inicio, fin, paso] con al menos un valor."""
+    if not isinstance(value, (list, tuple)) or len(value) != 3:
+        raise ValueError(f"{name} debe ser [inicio, fin, paso]")
+    start, stop, step = (float(x) for x in value)
+    if not all(np.isfinite([start, stop, step])) or step == 0:
+        raise ValueError(f"{name}: el paso debe ser finito y distinto de cero")
+    count = np.ceil((stop - start) / step)
+    if count < 1:
+        raise ValueError(f"{name} no contiene ningún valor")
+    if count > MAX_RANGE_VALUES:
+        raise ValueError(f"{name} tiene más de {MAX_RANGE_VALUES} valores")
+    return start, stop, step
+
+
+def parse_scan_request(body):
+    with_air_resistance = bool(body.get('with_air_resistance', False))
+    k1_range = parse_range(body.get('k1_range', [0.5, 20, 0.25]), 'k1_range')
+    k2_range = parse_range(body.get('k2_range', [0.5, 20, 0.25]), 'k2_range')
+    chunk_size = int(body.get('chunk_size', DEFAULT_CHUNK_SIZE))
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser mayor o igual a 1")
+    # Se valida antes de armar la grilla, que se construye en el event loop
+    n_candidates = len(np.arange(*k1_range)) * len(np.arange(*k2_range))
+    if n_candidates > MAX_CANDIDATES:
+        raise ValueError(f"La grilla tiene {n_candidates} candidatos (máximo {MAX_CANDIDATES})")
+    return build_candidates(k1_range, k2_range), with_air_resistance, chunk_size
+
+
+async def read_request(reader):
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    method, path, _version = request_line.decode('latin-1').split()
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get('content-length', 0))
+    body = json.loads(await reader.readexactly(length)) if length else {}
+    return method, path, body
+
+
+async def write_response(writer, status, payload):
+    data = json.dumps(payload).encode()
+    writer.write(f"HTTP/1.1 {status}\r\n"
+                 "Content-Type: application/json\r\n"
+                 f"Content-Length: {len(data)}\r\n"
+                 "Connection: close\r\n\r\n".encode() + data)
+    await writer.drain()
+
+
+async def write_chunk(writer, payload):
+    data = json.dumps(payload).encode() + b'\n'
+    writer.write(f"{len(data):X}\r\n".encode() + data + b'\r\n')
+    await writer.drain()
+
+
+async def handle_connection(server, reader, writer):
+    try:
+        request = await read_request(reader)
+        if request is None:
+            return
+        method, path, body = request
+
+        if method != 'POST':
+            await write_response(writer, '405 Method Not Allowed', {'error': 'Solo se acepta POST'})
+        elif path == '/simulate':
+            result = await server.simulate(float(body['k1']), float(body['k2']),
+                                           bool(body.get('with_air_resistance', False)))
+            await write_response(writer, '200 OK', result)
+        elif path == '/design':
+            result = await server.design(*parse_scan_request(body))
+            await write_response(writer, '200 OK', {'solution': result})
+        elif path == '/scan':
+            candidates, with_air_resistance, chunk_size = parse_scan_request(body)
+            writer.write(b"HTTP/1.1 200 OK\r\n"
+                         b"Content-Type: application/x-ndjson\r\n"
+                         b"Transfer-Encoding: chunked\r\n"
+                         b"Connection: close\r\n\r\n")
+            keys, futures = server.scan_chunks(candidates, with_air_resistance, chunk_size)
+            try:
+                # Los bloques se envían a medida que terminan, no en orden
+                for future in asyncio.as_completed([asyncio.shield(f) for f in futures]):
+                    await write_chunk(writer, await future)
+            except ConnectionError:
+                raise
+            except Exception as error:
+                # Los encabezados ya se enviaron: el error va como último bloque
+                await write_chunk(writer, {'error': str(error)})
+            finally:
+                server.release(keys)
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        else:
+            await write_response(writer, '404 Not Found', {'error': f"Ruta desconocida: {path}"})
+    except (KeyError, ValueError, TypeError) as error:
+        await write_response(writer, '400 Bad Request', {'error': str(error)})
+    except ConnectionError:
+        pass
+    except Exception as error:
+        # Falla del pool u otro error interno: se responde igual al cliente
+        try:
+            await write_response(writer, '500 Internal Server Error', {'error': repr(error)})
+        except ConnectionError:
+            pass
+    finally:
+        writer.close()
+
+
+async def serve(host, port, socket_path, workers):
+    server = SimulationServer(workers)
+    print(f"Iniciando pool con {server.workers} procesos...")
+    await server.start_pool()
+
+    async def handler(reader, writer):
+        await handle_connection(server, reader, writer)
+
+    if socket_path:
+        listener = await asyncio.start_unix_server(handler, path=socket_path)
+        print(f"Escuchando en el socket {socket_path}")
+    else:
+        listener = await asyncio.start_server(handler, host, port)
+        print(f"Escuchando en http://{host}:{port}")
+
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.shutdown()
+
+
+# EJECUCIÓN PRINCIPAL
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor local de simulaciones de bungee jumping")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--socket', help="Ruta de un socket Unix (reemplaza a host/port)")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.socket, args.workers))
+    except KeyboardInterrupt:
+        print("\nServidor detenido.")
@@ -0,0 +1,159 @@
+import numpy as np
+import punto_6y7 as bd
+
+# CAPA ADIMENSIONAL (SEMEJANZA) PARA LA PRIMERA CAÍDA
+#
+# Con eta = y / L0, tau = t * sqrt(g / L0) y u = d(eta)/d(tau) = v / sqrt(g L0),
+# la ecuación de movimiento queda:
+#
+#   d2(eta)/d(tau)2 = 1 - PI * (eta - 1)^k2 * [eta > 1] - GAMMA * sign(u) |u|^c2
+#
+#   PI    = k1 * L0^k2 / (m g)                (cuerda)
+#   GAMMA = c1 * (g L0)^(c2 / 2) / (m g)      (aire, 0 si no hay resistencia)
+#
+# Dos saltos con los mismos (PI, k2, GAMMA, c2) son el mismo salto a otra
+# escala: y_max = L0 * eta_max y a = g * alpha. Por eso en un barrido sobre
+# m, L0 o H alcanza con resolver una vez cada combinación reducida distinta.
+
+DTAU = 0.004  # Paso adimensional (~h = 0.01 s para el L0 del problema)
+GUARD = 10.0  # Corte de seguridad de simulate_first_drop: y_max > H + GUARD [m]
+
+# Soluciones reducidas ya calculadas: clave -> (eta_max, alpha_at_max).
+# Una solución que terminó antes de su corte vale para cualquier corte por
+# encima de eta_max, así que la clave no incluye el corte. Las que llegaron
+# al corte dependen de él y se guardan aparte con (clave, corte).
+_reduced_cache = {}
+_cut_cache = {}
+
+
+def _round_key(x):
+    """Redondea a 12 cifras para que combinaciones equivalentes coincidan."""
+    return float(f"{x:.12g}")
+
+
+def reduced_params(k1, k2, with_air_resistance=False, m=bd.m, L0=bd.L0, c1=bd.c1, c2=bd.c2):
+    """
+    Devuelve los grupos adimensionales (PI, GAMMA) de un salto.
+    Acepta arrays (se aplica broadcasting).
+    """
+    pi = k1 * np.power(L0, np.asarray(k2, dtype=float)) / (m * bd.g)
+    if with_air_resistance:
+        gamma = c1 * (bd.g * L0) ** (c2 / 2.0) / (m * bd.g)
+    else:
+        gamma = 0.0
+    return pi, gamma
+
+
+def solve_reduced_first_drop(pi, k2, gamma=0.0, c2=bd.c2, dtau=DTAU, eta_limit=(bd.H + GUARD) / bd.L0):
+    """
+    Integra la primera caída adimensional con RK4 hasta que u < 0, o hasta
+    que eta_max pasa eta_limit (el corte H + 10 en unidades de L0).
+    Retorna (eta_max, alpha_at_max). El resultado queda en caché.
+    """
+    key = (_round_key(pi), _round_key(k2), _round_key(gamma), _round_key(c2) if gamma else 0.0, dtau)
+    cut_key = (key, _round_key(eta_limit))
+    if key in _reduced_cache and _reduced_cache[key][0] <= eta_limit:
+        return _reduced_cache[key]
+    if cut_key in _cut_cache:
+        return _cut_cache[cut_key]
+
+    def reduced_acceleration(eta, u):
+        alpha = 1.0
+        if eta > 1.0:
+            alpha -= pi * (eta - 1.0) ** k2
+        if gamma:
+            alpha -= np.sign(u) * gamma * abs(u) ** c2
+        return alpha
+
+    def state_derivative(current_state):
+        eta, u = current_state
+        return np.array([u, reduced_acceleration(eta, u)])
+
+    state = np.array([0.0, 0.0])  # [eta, u]
+    eta_max = 0.0
+    alpha_at_max = 0.0
+
+    while state[1] >= 0:
+        k1_v = dtau * state_derivative(state)
+        k2_v = dtau * state_derivative(state + 0.5 * k1_v)
+        k3_v = dtau * state_derivative(state + 0.5 * k2_v)
+        k4_v = dtau * state_derivative(state + k3_v)
+        state += (k1_v + 2 * k2_v + 2 * k3_v + k4_v) / 6.0
+
+        if state[0] > eta_max:
+            eta_max = state[0]
+            alpha_at_max = reduced_acceleration(state[0], state[1])
+
+        # Corte de seguridad: la cuerda es tan blanda que el resultado
+        # ya no sirve (el saltador llega al suelo de cualquier sitio)
+        if eta_max > eta_limit:
+            _cut_cache[cut_key] = (eta_max, alpha_at_max)
+            return eta_max, alpha_at_max
+
+    _reduced_cache[key] = (eta_max, alpha_at_max)
+    return eta_max, alpha_at_max
+
+
+def simulate_first_drop_similar(k1, k2, with_air_resistance=False, m=bd.m, L0=bd.L0, H=bd.H):
+    """
+    Equivalente a punto_6y7.simulate_first_drop pero resolviendo el
+    problema reducido y reescalando. Retorna (y_max, a_at_ymax).
+    """
+    pi, gamma = reduced_params(k1, k2, with_air_resistance, m, L0)
+    eta_max, alpha_at_max = solve_reduced_first_drop(pi, k2, gamma, eta_limit=(H + GUARD) / L0)
+    return L0 * eta_max, bd.g * alpha_at_max
+
+
+def sweep_first_drop(k1, k2, with_air_resistance=False, m=bd.m, L0=bd.L0, H=bd.H):
+    """
+    Barrido vectorizado sobre arrays de k1, k2, m, L0 y H (con
+    broadcasting). Solo se resuelve una vez cada combinación reducida
+    distinta, con el corte más alto del grupo; se vuelven a resolver solo
+    los casos que pasan su propio corte. Retorna arrays (y_max, a_at_ymax)
+    con la forma del broadcasting.
+    """
+    k1, k2, m, L0, H = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (k1, k2, m, L0, H)])
+    pi, gamma = reduced_params(k1, k2, with_air_resistance, m, L0)
+    gamma = np.broadcast_to(gamma, k1.shape)
+    eta_limit = (H + GUARD) / L0
+
+    keys = np.column_stack([np.vectorize(_round_key)(x).ravel() for x in (pi, k2, gamma)])
+    unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    limits = eta_limit.ravel()
+    group_limit = np.full(len(unique_keys), -np.inf)
+    np.maximum.at(group_limit, inverse, limits)
+
+    reduced = np.array([solve_reduced_first_drop(pi_u, k2_u, gamma_u, eta_limit=limit_u)
+                        for (pi_u, k2_u, gamma_u), limit_u in zip(unique_keys, group_limit)])
+    eta_max = reduced[inverse, 0]
+    alpha_at_max = reduced[inverse, 1]
+
+    # Los casos que pasan su propio corte se detienen en él
+    for index in np.nonzero(eta_max > limits)[0]:
+        pi_u, k2_u, gamma_u = unique_keys[inverse[index]]
+        eta_max[index], alpha_at_max[index] = solve_reduced_first_drop(
+            pi_u, k2_u, gamma_u, eta_limit=limits[index])
+    eta_max = eta_max.reshape(k1.shape)
+    alpha_at_max = alpha_at_max.reshape(k1.shape)
+
+    return L0 * eta_max, bd.g * alpha_at_max
+
+
+# EJECUCIÓN PRINCIPAL
+if __name__ == "__main__":
+    print("Comparación con punto_6y7.simulate_first_drop (k1=8.5, k2=1.25):")
+    for air in (False, True):
+        y_ref, a_ref = bd.simulate_first_drop(8.5, 1.25, air)
+        y_sim, a_sim = simulate_first_drop_similar(8.5, 1.25, air)
+        print(f"  Aire={air}: RK4 y_max={y_ref:.3f} m, a={a_ref:.3f} | "
+              f"Reducido y_max={y_sim:.3f} m, a={a_sim:.3f}")
+
+    # Saltadores de distinta masa en cuerdas con k1 proporcional a la masa:
+    # sin aire todos comparten el mismo PI y se resuelven una sola vez
+    masses = np.linspace(50, 130, 41)
+    _reduced_cache.clear()
+    _cut_cache.clear()
+    y_max, a_max = sweep_first_drop(8.5 * masses / bd.m, 1.25, False, m=masses)
+    print(f"  Barrido: {masses.size} casos -> {len(_reduced_cache) + len(_cut_cache)} simulaciones reducidas")
+    print(f"  y_max para todas las masas: {y_max.min():.3f} .. {y_max.max():.3f} m")
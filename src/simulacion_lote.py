@@ -0,0 +1,187 @@
+import os
+import time
+
+import numpy as np
+from punto_6y7 import m, L0, g, c1, c2, A_MAX_LIMIT, Y_MIN_TARGET, Y_MAX_TARGET
+
+# SIMULACIÓN EN LOTE DEL SALTO COMPLETO
+# Integra muchas cuerdas (k1, k2, aire) a la vez con RK4 sobre una grilla
+# de tiempo común. Cada variable se guarda en un array (n_cuerdas, n_pasos),
+# opcionalmente memory-mapped en disco, y las métricas por rebote se
+# calculan vectorizadas sobre todo el lote.
+
+CHUNK_STEPS = 256
+
+
+def batch_acceleration(y, v, k1, k2, with_air_resistance):
+    """
+    Aceleración vectorizada sobre el lote (misma física que
+    punto_6y7.get_acceleration).
+    """
+    f_elastica = k1 * np.maximum(y - L0, 0.0) ** k2
+    f_viscosa = np.where(with_air_resistance, np.sign(v) * c1 * np.abs(v) ** c2, 0.0)
+    return g - (f_elastica + f_viscosa) / m
+
+
+def _allocate(out_dir, name, shape):
+    if out_dir is None:
+        return np.empty(shape)
+    return np.lib.format.open_memmap(os.path.join(out_dir, name + '.npy'), mode='w+',
+                                     dtype=np.float64, shape=shape)
+
+
+def simulate_jump_batch(k1, k2, with_air_resistance, t_max=40, h=0.05, out_dir=None,
+                        chunk_steps=CHUNK_STEPS):
+    """
+    Simula el salto completo para un lote de cuerdas.
+
+    Args:
+        k1, k2, with_air_resistance: Escalares o arrays (con broadcasting).
+        t_max (float): Tiempo total de simulación en segundos.
+        h (float): Paso de tiempo común a todo el lote.
+        out_dir (str): Si se indica, los resultados se escriben en archivos
+            .npy memory-mapped dentro de ese directorio.
+        chunk_steps (int): Pasos que se acumulan en memoria antes de
+            volcarlos al array de salida.
+
+    Returns:
+        dict: 't' (n_pasos,) y 'y', 'v', 'a' de forma (n_cuerdas, n_pasos).
+    """
+    k1, k2, air = np.broadcast_arrays(np.asarray(k1, dtype=float),
+                                      np.asarray(k2, dtype=float),
+                                      np.asarray(with_air_resistance, dtype=bool))
+    k1, k2, air = k1.ravel(), k2.ravel(), air.ravel()
+    n_cords = k1.size
+    n_steps = int(np.floor(t_max / h + 1e-9)) + 1
+
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+    history = {'t': h * np.arange(n_steps)}
+    for key in ('y', 'v', 'a'):
+        history[key] = _allocate(out_dir, key, (n_cords, n_steps))
+
+    def derivative(y, v):
+        return v, batch_acceleration(y, v, k1, k2, air)
+
+    y = np.zeros(n_cords)
+    v = np.zeros(n_cords)
+    buffer = {key: np.empty((n_cords, chunk_steps)) for key in ('y', 'v', 'a')}
+
+    for chunk_start in range(0, n_steps, chunk_steps):
+        chunk_len = min(chunk_steps, n_steps - chunk_start)
+        for j in range(chunk_len):
+            dy1, dv1 = derivative(y, v)
+            buffer['y'][:, j] = y
+            buffer['v'][:, j] = v
+            buffer['a'][:, j] = dv1
+
+            # Pasos de Runge-Kutta 4 para todas las cuerdas a la vez
+            dy2, dv2 = derivative(y + 0.5 * h * dy1, v + 0.5 * h * dv1)
+            dy3, dv3 = derivative(y + 0.5 * h * dy2, v + 0.5 * h * dv2)
+            dy4, dv4 = derivative(y + h * dy3, v + h * dv3)
+            y = y + h * (dy1 + 2 * dy2 + 2 * dy3 + dy4) / 6.0
+            v = v + h * (dv1 + 2 * dv2 + 2 * dv3 + dv4) / 6.0
+
+        for key in ('y', 'v', 'a'):
+            history[key][:, chunk_start:chunk_start + chunk_len] = buffer[key][:, :chunk_len]
+            if isinstance(history[key], np.memmap):
+                history[key].flush()
+
+    if out_dir is not None:
+        np.save(os.path.join(out_dir, 't.npy'), history['t'])
+    return history
+
+
+def load_batch(out_dir):
+    """Abre (memory-mapped) un lote guardado por simulate_jump_batch."""
+    return {key: np.load(os.path.join(out_dir, key + '.npy'), mmap_mode='r')
+            for key in ('t', 'y', 'v', 'a')}
+
+
+def bounce_metrics(history):
+    """
+    Métricas por rebote para todo el lote. Un rebote va desde que el
+    saltador empieza a bajar (v pasa a ser >= 0) hasta el siguiente inicio
+    de bajada.
+
+    Returns:
+        dict con arrays (n_cuerdas, n_rebotes), NaN donde no hay rebote:
+            'y_max': punto más bajo del rebote [m]
+            'peak_g': máximo de |a| en el rebote [g]
+            'rebound_y': punto más alto de la subida que cierra el rebote [m]
+        y 'n_bounces': cantidad de puntos más bajos por cuerda.
+    """
+    y = np.asarray(history['y'])
+    v = np.asarray(history['v'])
+    a = np.asarray(history['a'])
+    n_cords, n_steps = y.shape
+
+    # Cambios de signo de v: arranque de bajada (tope) y punto más bajo
+    starts = (v[:, :-1] < 0) & (v[:, 1:] >= 0)
+    bottoms = (v[:, :-1] >= 0) & (v[:, 1:] < 0)
+    bounce = np.zeros((n_cords, n_steps), dtype=int)
+    bounce[:, 1:] = np.cumsum(starts, axis=1)
+
+    n_bounces = bottoms.sum(axis=1)
+    max_bounces = int(bounce.max()) + 1
+    flat = (np.arange(n_cords)[:, None] * max_bounces + bounce).ravel()
+
+    y_max = np.full(n_cords * max_bounces, -np.inf)
+    peak_g = np.full(n_cords * max_bounces, -np.inf)
+    rebound_y = np.full(n_cords * max_bounces, np.inf)
+    np.maximum.at(y_max, flat, y.ravel())
+    np.maximum.at(peak_g, flat, np.abs(a).ravel() / g)
+    rising = (v < 0).ravel()
+    np.minimum.at(rebound_y, flat[rising], y.ravel()[rising])
+
+    # Solo cuentan los rebotes que llegaron a su punto más bajo (y a su
+    # tope, para la altura de rebote) dentro del tiempo simulado
+    index = np.arange(max_bounces)[None, :]
+    reached_bottom = index < n_bounces[:, None]
+    reached_top = index < (starts.sum(axis=1))[:, None]
+
+    metrics = {
+        'y_max': np.where(reached_bottom, y_max.reshape(n_cords, max_bounces), np.nan),
+        'peak_g': np.where(reached_bottom, peak_g.reshape(n_cords, max_bounces), np.nan),
+        'rebound_y': np.where(reached_top, rebound_y.reshape(n_cords, max_bounces), np.nan),
+        'n_bounces': n_bounces,
+    }
+    return metrics
+
+
+def check_multi_bounce(metrics, g_limit=A_MAX_LIMIT / g, y_limit=Y_MAX_TARGET, y_first_min=Y_MIN_TARGET):
+    """
+    Verificación de seguridad de todos los rebotes de cada cuerda: ningún
+    punto más bajo supera y_limit ni ningún rebote supera g_limit, y la
+    primera caída llega por debajo de y_first_min.
+    Retorna un array booleano (n_cuerdas,).
+    """
+    with np.errstate(invalid='ignore'):
+        depth_ok = np.all(np.isnan(metrics['y_max']) | (metrics['y_max'] < y_limit), axis=1)
+        g_ok = np.all(np.isnan(metrics['peak_g']) | (metrics['peak_g'] < g_limit), axis=1)
+        first_ok = metrics['y_max'][:, 0] > y_first_min
+    return depth_ok & g_ok & first_ok
+
+
+# EJECUCIÓN PRINCIPAL
+if __name__ == "__main__":
+    from simulacion_punto_6y7 import simulate_jump_history
+
+    k1_grid, k2_grid = np.meshgrid(np.arange(2, 20, 0.5), np.arange(1, 1.5, 0.05))
+    k1_values = np.concatenate([k1_grid.ravel(), k1_grid.ravel()])
+    k2_values = np.concatenate([k2_grid.ravel(), k2_grid.ravel()])
+    air_values = np.repeat([False, True], k1_grid.size)
+    print(f"Simulando {k1_values.size} cuerdas en lote (40 s, h = 0.05 s)...")
+
+    start = time.perf_counter()
+    batch = simulate_jump_batch(k1_values, k2_values, air_values)
+    metrics = bounce_metrics(batch)
+    safe = check_multi_bounce(metrics)
+    print(f"  Tiempo total: {time.perf_counter() - start:.2f} s")
+    print(f"  Cuerdas que cumplen en todos los rebotes: {np.count_nonzero(safe)}")
+
+    # Verificación contra la simulación individual
+    single = simulate_jump_history(k1_values[0], k2_values[0], bool(air_values[0]))
+    n = min(single['y'].size, batch['y'].shape[1])
+    print(f"  Diferencia máxima con simulate_jump_history: "
+          f"{np.max(np.abs(single['y'][:n] - batch['y'][0, :n])):.2e} m")
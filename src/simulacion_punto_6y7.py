@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from punto_6y7 import m, L0, g, c1, c2
+from punto_6y7 import m, L0, g, c1, c2, get_acceleration
+from trayectoria import integrate_rk4
 
 # --- MOTOR DE SIMULACIÓN (ADAPTADO PARA SER REUTILIZABLE) ---
 
@@ -61,6 +62,18 @@ def simulate_jump_history(k1, k2, with_air_resistance, t_max=40, h=0.05):
     return history
 
 
+def simulate_jump_trajectory(k1, k2, with_air_resistance, t_max=40, h=0.05):
+    """
+    Igual que simulate_jump_history pero devuelve un objeto Trajectory que
+    guarda solo los pasos de RK4 y permite evaluar y, v, a en cualquier
+    instante (salida densa con interpolación de Hermite).
+    """
+    def acceleration(y, v):
+        return get_acceleration(y, v, k1, k2, with_air_resistance)
+
+    return integrate_rk4(acceleration, h, t_max)
+
+
 # --- FUNCIÓN PRINCIPAL DE GRAFICACIÓN ---
 
 def plot_simulation(k1, k2, with_air_resistance=False):
@@ -69,8 +82,14 @@ def plot_simulation(k1, k2, with_air_resistance=False):
     """
     print(f"\nGenerando gráfico para k1={k1}, k2={k2} (Resistencia del Aire: {'Sí' if with_air_resistance else 'No'})...")
     
-    # 1. Ejecutar la simulación para obtener los datos
-    data = simulate_jump_history(k1, k2, with_air_resistance)
+    # 1. Ejecutar la simulación. Para graficar alcanza con la resolución
+    # del integrador; la salida densa se usa para ubicar los puntos más
+    # bajos entre pasos
+    trajectory = simulate_jump_trajectory(k1, k2, with_air_resistance)
+    data = trajectory.sample(trajectory.t[1] - trajectory.t[0])
+
+    for t_peak, y_peak in zip(*trajectory.maxima()):
+        print(f"  Punto más bajo: t = {t_peak:.3f} s, y = {y_peak:.2f} m")
     
     # 2. Convertir unidades para los gráficos
     data['v'] *= 3.6  # m/s -> km/h
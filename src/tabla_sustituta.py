@@ -0,0 +1,293 @@
+import argparse
+import bisect
+import itertools
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import punto_6y7 as bd
+
+# TABLA SUSTITUTA (SURROGATE) DE LA PRIMERA CAÍDA
+# Se tabulan y_max y la aceleración en y_max sobre una grilla 4-D
+# (k1, k2, m, H), con y sin resistencia del aire, usando el motor de
+# punto_6y7. Las consultas se responden interpolando la tabla, sin integrar.
+#
+# La interpolación es multilineal en (log k1, k2, m, H) sobre
+# log(y_max - L0): y_max - L0 se comporta como una potencia de k1 y de
+# L0^k2, así que en esas coordenadas es casi lineal.
+#
+# La banda válida (0.9 H < y_max < H) queda a pocos metros del corte
+# H + 10 de simulate_first_drop, así que los vértices de la tabla se
+# simulan con el corte en DEEP_CUT * H + 10: conocen la profundidad real
+# de las cuerdas que se pasan del sitio y la interpolación no se rompe al
+# lado de la banda. Las celdas con algún vértice que llegó a ese corte no
+# se interpolan: esas consultas se marcan como "hay que simular".
+#
+# Formato en disco (un directorio):
+#   valores.npy -> float32 de forma (2, n_k1, n_k2, n_m, n_H, 2)
+#                  [sin/con aire, ..., (y_max, a_at_ymax)]
+#   tabla.json  -> ejes de la grilla y cotas de error medidas
+
+# La longitud natural se escala con la altura del sitio igual que en el enunciado
+L0_SOBRE_H = bd.L0 / bd.H
+
+DEFAULT_AXES = {
+    'k1': np.geomspace(0.5, 20.0, 14),
+    'k2': np.arange(0.5, 3.01, 0.1),
+    'm': np.linspace(50.0, 130.0, 6),
+    'H': np.linspace(100.0, 200.0, 5),
+}
+
+VALUES_FILE = 'valores.npy'
+META_FILE = 'tabla.json'
+GUARD = 10.0  # Corte de seguridad de simulate_first_drop: y_max > H + GUARD
+DEEP_CUT = 2.0  # Los vértices se simulan con el corte en DEEP_CUT * H + GUARD
+MARGIN_SAFETY = 2.0  # Las cotas medidas en validate() se amplían por este factor
+
+
+def _simulate_point(args):
+    """Primera caída de un punto (k1, k2, m, H, aire[, altura del corte])."""
+    k1, k2, m, H, with_air_resistance = args[:5]
+    H_cut = args[5] if len(args) > 5 else H
+    y_max, a_max = bd.simulate_first_drop(k1, k2, with_air_resistance,
+                                          m=m, L0=L0_SOBRE_H * H, H=H_cut)
+    return float(y_max), float(a_max)
+
+
+def build_table(path, axes=None, workers=None):
+    """
+    Simula todos los puntos de la grilla (en paralelo) y guarda la tabla
+    en el directorio path.
+    """
+    axes = {name: np.asarray(values, dtype=float)
+            for name, values in (axes or DEFAULT_AXES).items()}
+    shape = tuple(len(axes[name]) for name in ('k1', 'k2', 'm', 'H'))
+    values = np.empty((2,) + shape + (2,), dtype=np.float32)
+
+    jobs = [(k1, k2, m, H, air, DEEP_CUT * H)
+            for air in (False, True)
+            for k1, k2, m, H in itertools.product(axes['k1'], axes['k2'], axes['m'], axes['H'])]
+    print(f"Construyendo tabla con {len(jobs)} simulaciones...")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_simulate_point, jobs, chunksize=32))
+    values[...] = np.asarray(results, dtype=np.float32).reshape(values.shape)
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, VALUES_FILE), values)
+    meta = {name: axes[name].tolist() for name in axes}
+    with open(os.path.join(path, META_FILE), 'w') as file:
+        json.dump(meta, file, indent=2)
+    return SurrogateTable(path)
+
+
+class SurrogateTable:
+    """
+    Tabla memory-mapped con interpolación multilineal vectorizada.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, META_FILE)) as file:
+            self.meta = json.load(file)
+        self.axes = [np.asarray(self.meta[name]) for name in ('k1', 'k2', 'm', 'H')]
+        self.values = np.load(os.path.join(path, VALUES_FILE), mmap_mode='r')
+        # Vista ndarray del mismo mapeo: evita el costo de crear un memmap por consulta
+        self._raw_values = self.values.view(np.ndarray)
+        # k1 se interpola en escala logarítmica
+        self._grid = [np.log(self.axes[0])] + self.axes[1:]
+        self._grid_lists = [axis.tolist() for axis in self._grid]
+
+    @property
+    def error_bounds(self):
+        """Cotas de error medidas con validate() (None si no se validó)."""
+        return self.meta.get('error_bounds')
+
+    def _combine(self, vertices, H_vertices, weights, H):
+        """
+        Combina los valores de los vértices de las celdas: interpola
+        log(y_max - L0) y a_at_ymax. Devuelve NaN donde algún vértice llegó
+        al corte DEEP_CUT * H + 10.
+        """
+        y_vertices = vertices[..., 0].astype(float)
+        capped = np.any(y_vertices > DEEP_CUT * H_vertices + GUARD, axis=-1)
+        log_stretch = np.log(np.maximum(y_vertices - L0_SOBRE_H * H_vertices, 1e-12))
+        y_max = np.exp(np.sum(weights * log_stretch, axis=-1)) + L0_SOBRE_H * H
+        a_max = np.sum(weights * vertices[..., 1], axis=-1)
+        y_max = np.where(capped, np.nan, y_max)
+        a_max = np.where(capped, np.nan, a_max)
+        return y_max, a_max
+
+    def _query_scalar(self, point, with_air_resistance):
+        """
+        Camino rápido para una sola consulta: lee el bloque de 2^4 vértices
+        de la celda y combina en Python, sin armar arrays intermedios.
+        """
+        if not point[0] > 0:
+            return math.nan, math.nan
+        x = [math.log(point[0])] + point[1:]
+        indices, fractions = [], []
+        for axis, value in zip(self._grid_lists, x):
+            if not axis[0] <= value <= axis[-1]:
+                return math.nan, math.nan
+            i = min(bisect.bisect_right(axis, value) - 1, len(axis) - 2)
+            indices.append(i)
+            fractions.append((value - axis[i]) / (axis[i + 1] - axis[i]))
+
+        i1, i2, i3, i4 = indices
+        block = self._raw_values[int(bool(with_air_resistance)),
+                                 i1:i1 + 2, i2:i2 + 2, i3:i3 + 2, i4:i4 + 2].tolist()
+        H_cell = self._grid_lists[3][i4:i4 + 2]
+        t1, t2, t3, t4 = fractions
+        log_stretch, a_max = 0.0, 0.0
+        for b1, plane1 in enumerate(block):
+            w1 = t1 if b1 else 1.0 - t1
+            for b2, plane2 in enumerate(plane1):
+                w2 = w1 * (t2 if b2 else 1.0 - t2)
+                for b3, plane3 in enumerate(plane2):
+                    w3 = w2 * (t3 if b3 else 1.0 - t3)
+                    for b4, (y_vertex, a_vertex) in enumerate(plane3):
+                        if y_vertex > DEEP_CUT * H_cell[b4] + GUARD:
+                            return math.nan, math.nan
+                        weight = w3 * (t4 if b4 else 1.0 - t4)
+                        log_stretch += weight * math.log(max(y_vertex - L0_SOBRE_H * H_cell[b4], 1e-12))
+                        a_max += weight * a_vertex
+        return math.exp(log_stretch) + L0_SOBRE_H * point[3], a_max
+
+    def query(self, k1, k2, m, H, with_air_resistance=False):
+        """
+        Interpola y_max y a_at_ymax para arrays de consultas (se aplica
+        broadcasting entre los argumentos). Para cuerdas que pasan el corte
+        H + 10 se devuelve la profundidad que dicta la física, no la del
+        corte. Devuelve NaN en los puntos que la tabla no resuelve: fuera
+        de la grilla o en celdas que tocan el corte de la tabla. Esos puntos
+        hay que simularlos.
+        """
+        if all(np.ndim(x) == 0 for x in (k1, k2, m, H)):
+            return self._query_scalar([float(x) for x in (k1, k2, m, H)], with_air_resistance)
+
+        points = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (k1, k2, m, H)])
+        shape = points[0].shape
+        points = [p.ravel() for p in points]
+        table = self.values[int(bool(with_air_resistance))]
+
+        # Índice de la celda y coordenada local [0, 1] en cada eje
+        indices, fractions = [], []
+        inside = np.ones(points[0].shape, dtype=bool)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_values = [np.log(points[0])] + points[1:]
+        for axis, x in zip(self._grid, x_values):
+            i = np.clip(np.searchsorted(axis, x, side='right') - 1, 0, len(axis) - 2)
+            indices.append(i)
+            fractions.append((x - axis[i]) / (axis[i + 1] - axis[i]))
+            inside &= (x >= axis[0]) & (x <= axis[-1])
+
+        # Pesos y valores de los 16 vértices de cada celda
+        corners = list(itertools.product((0, 1), repeat=4))
+        weights = np.ones(points[0].shape + (16,))
+        vertices = np.empty(points[0].shape + (16, 2), dtype=np.float32)
+        H_vertices = np.empty(points[0].shape + (16,))
+        for n, corner in enumerate(corners):
+            for bit, t in zip(corner, fractions):
+                weights[:, n] *= t if bit else 1.0 - t
+            vertices[:, n] = table[tuple(i + bit for i, bit in zip(indices, corner))]
+            H_vertices[:, n] = self.axes[3][indices[3] + corner[3]]
+
+        y_max, a_max = self._combine(vertices, H_vertices, weights, points[3])
+        y_max[~inside] = np.nan
+        a_max[~inside] = np.nan
+        return y_max.reshape(shape), a_max.reshape(shape)
+
+    def is_safe(self, k1, k2, m, H, with_air_resistance=False, use_error_bounds=True,
+                simulate_uncertain=True):
+        """
+        Verifica las condiciones del problema (0.9 H < y_max < H y
+        |a| < 2.5 g) para arrays de consultas.
+
+        Si la tabla fue validada, un veredicto solo se toma de la tabla
+        cuando las cotas de error (por MARGIN_SAFETY) no alcanzan a
+        cambiarlo. Los puntos dudosos y los que la tabla no resuelve se
+        simulan con simulate_first_drop; con simulate_uncertain=False se
+        rechazan.
+        """
+        k1, k2, m, H = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (k1, k2, m, H)])
+        y_max, a_max = self.query(k1, k2, m, H, with_air_resistance)
+        y_max, a_max = np.asarray(y_max), np.asarray(a_max)
+        margin_y, margin_a = 0.0, 0.0
+        if use_error_bounds and self.error_bounds:
+            bounds = self.error_bounds['con_aire' if with_air_resistance else 'sin_aire']
+            margin_y = MARGIN_SAFETY * bounds['y_max']
+            margin_a = MARGIN_SAFETY * bounds['a_max']
+
+        a_limit = 2.5 * bd.g
+        with np.errstate(invalid='ignore'):
+            condicion_altura = (0.9 * H < y_max) & (y_max < H)
+            condicion_aceleracion = np.abs(a_max) < a_limit
+            altura_dudosa = (np.abs(y_max - 0.9 * H) <= margin_y) | (np.abs(y_max - H) <= margin_y)
+            aceleracion_dudosa = np.abs(np.abs(a_max) - a_limit) <= margin_a
+        # Si una condición falla con certeza, la otra no importa
+        falla_segura = ((~altura_dudosa & ~condicion_altura)
+                        | (~aceleracion_dudosa & ~condicion_aceleracion))
+        uncertain = np.isnan(y_max) | ((altura_dudosa | aceleracion_dudosa) & ~falla_segura)
+        safe = condicion_altura & condicion_aceleracion & ~uncertain
+
+        if simulate_uncertain:
+            for index in zip(*np.nonzero(uncertain)):
+                y_val, a_val = _simulate_point((k1[index], k2[index], m[index], H[index],
+                                                with_air_resistance))
+                safe[index] = (0.9 * H[index] < y_val < H[index]) and abs(a_val) < a_limit
+        return safe
+
+    def validate(self, n_samples=500, seed=0, workers=None):
+        """
+        Compara la interpolación contra simulaciones en puntos aleatorios
+        dentro de la grilla y guarda el error máximo en tabla.json.
+        Solo se consideran puntos que la tabla resuelve (no tocan el corte
+        de la tabla) y con y_max < H, donde la tabla se usa para decidir (por
+        encima del sitio el resultado es inválido igual).
+        """
+        rng = np.random.default_rng(seed)
+        samples = [rng.uniform(axis[0], axis[-1], n_samples) for axis in self._grid]
+        samples[0] = np.exp(samples[0])
+        bounds = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for air, name in ((False, 'sin_aire'), (True, 'con_aire')):
+                jobs = [(*point, air) for point in zip(*samples)]
+                exact = np.asarray(list(pool.map(_simulate_point, jobs, chunksize=16)))
+                y_max, a_max = self.query(*samples, with_air_resistance=air)
+                resolved = ~np.isnan(y_max)
+                relevant = resolved & (exact[:, 0] < samples[3])
+                if not np.any(relevant):
+                    relevant = resolved
+                bounds[name] = {
+                    'y_max': float(np.max(np.abs(y_max - exact[:, 0])[relevant])),
+                    'a_max': float(np.max(np.abs(a_max - exact[:, 1])[relevant])),
+                    'n_samples': int(np.count_nonzero(relevant)),
+                    'sin_resolver': float(np.mean(~resolved)),
+                }
+                print(f"  {name}: error máx. y_max = {bounds[name]['y_max']:.3f} m, "
+                      f"a_max = {bounds[name]['a_max']:.3f} m/s^2 "
+                      f"({100 * bounds[name]['sin_resolver']:.0f}% de las consultas hay que simularlas)")
+
+        self.meta['error_bounds'] = bounds
+        with open(os.path.join(self.path, META_FILE), 'w') as file:
+            json.dump(self.meta, file, indent=2)
+        return bounds
+
+
+# EJECUCIÓN PRINCIPAL
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Construye y valida la tabla sustituta")
+    parser.add_argument('path', nargs='?', default='../outputs/tabla_sustituta')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--samples', type=int, default=500)
+    args = parser.parse_args()
+
+    table = build_table(args.path, workers=args.workers)
+    print("Validando contra simulaciones puntuales...")
+    table.validate(n_samples=args.samples, workers=args.workers)
+
+    y_max, a_max = table.query(8.5, 1.25, bd.m, bd.H)
+    print(f"\nConsulta k1=8.5, k2=1.25 (Punto 6): y_max = {y_max:.2f} m, a = {a_max:.2f} m/s^2")
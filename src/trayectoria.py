@@ -0,0 +1,134 @@
+import numpy as np
+
+# TRAYECTORIAS CON SALIDA DENSA
+# Se guardan solo los pasos aceptados (t, y, v, a) y entre ellos se
+# interpola con polinomios cúbicos de Hermite:
+#   y(t): Hermite con (y, v) en los extremos del paso
+#   v(t): Hermite con (v, a) en los extremos del paso
+#   a(t): derivada del interpolante de v
+# Así se puede muestrear la solución tan fino como se quiera y ubicar los
+# extremos entre pasos sin integrar con h chico.
+
+
+def _hermite_coefficients(p0, p1, d0, d1, dt):
+    """
+    Coeficientes de p(s) = p0 + c1 s + c2 s^2 + c3 s^3 en s = (t - t0) / dt,
+    con p'(0) = d0 y p'(1) = d1 (derivadas respecto de t).
+    """
+    c1 = dt * d0
+    c2 = 3 * (p1 - p0) - dt * (2 * d0 + d1)
+    c3 = -2 * (p1 - p0) + dt * (d0 + d1)
+    return c1, c2, c3
+
+
+class Trajectory:
+    """
+    Trayectoria de un salto almacenada en los pasos aceptados del
+    integrador, evaluable en cualquier instante de [t[0], t[-1]].
+    """
+
+    def __init__(self, t, y, v, a):
+        self.t = np.asarray(t, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.v = np.asarray(v, dtype=float)
+        self.a = np.asarray(a, dtype=float)
+
+    @property
+    def nbytes(self):
+        """Memoria ocupada por los datos guardados."""
+        return self.t.nbytes + self.y.nbytes + self.v.nbytes + self.a.nbytes
+
+    def evaluate(self, times):
+        """
+        Devuelve (y, v, a) en los instantes pedidos (array o escalar).
+        """
+        times = np.asarray(times, dtype=float)
+        i = np.clip(np.searchsorted(self.t, times, side='right') - 1, 0, len(self.t) - 2)
+        dt = self.t[i + 1] - self.t[i]
+        s = (times - self.t[i]) / dt
+
+        c1, c2, c3 = _hermite_coefficients(self.y[i], self.y[i + 1], self.v[i], self.v[i + 1], dt)
+        y = self.y[i] + s * (c1 + s * (c2 + s * c3))
+
+        c1, c2, c3 = _hermite_coefficients(self.v[i], self.v[i + 1], self.a[i], self.a[i + 1], dt)
+        v = self.v[i] + s * (c1 + s * (c2 + s * c3))
+        a = (c1 + s * (2 * c2 + s * 3 * c3)) / dt
+        return y, v, a
+
+    def sample(self, dt):
+        """
+        Muestrea la trayectoria con paso dt y devuelve un dict con el mismo
+        formato que simulate_jump_history ({'t', 'y', 'v', 'a'}).
+        """
+        times = np.arange(self.t[0], self.t[-1], dt)
+        y, v, a = self.evaluate(times)
+        return {'t': times, 'y': y, 'v': v, 'a': a}
+
+    def extrema(self):
+        """
+        Ubica los extremos de y (v = 0) dentro de los pasos, usando las
+        raíces de la derivada del interpolante de y.
+        Retorna (t, y, es_maximo) como arrays.
+        """
+        dt = np.diff(self.t)
+        y0 = self.y[:-1]
+        c1, c2, c3 = _hermite_coefficients(y0, self.y[1:], self.v[:-1], self.v[1:], dt)
+
+        # Raíces de y'(s) = c1 + 2 c2 s + 3 c3 s^2 en [0, 1)
+        roots = []
+        with np.errstate(divide='ignore', invalid='ignore'):
+            disc = np.sqrt(np.maximum(4 * c2 * c2 - 12 * c3 * c1, 0.0))
+            quadratic = np.abs(c3) > 1e-12 * (np.abs(c1) + np.abs(c2) + 1e-300)
+            roots.append(np.where(quadratic, (-2 * c2 + disc) / (6 * c3), -c1 / (2 * c2)))
+            roots.append(np.where(quadratic, (-2 * c2 - disc) / (6 * c3), np.nan))
+            has_real_roots = 4 * c2 * c2 - 12 * c3 * c1 >= 0
+
+        found_t, found_y, found_max = [], [], []
+        for s in roots:
+            valid = has_real_roots & (s >= 0) & (s < 1)
+            s = s[valid]
+            step_c1, step_c2, step_c3 = c1[valid], c2[valid], c3[valid]
+            found_t.append(self.t[:-1][valid] + s * dt[valid])
+            found_y.append(y0[valid] + s * (step_c1 + s * (step_c2 + s * step_c3)))
+            # Es máximo si la derivada segunda es negativa
+            found_max.append(2 * step_c2 + 6 * step_c3 * s < 0)
+
+        t_ext = np.concatenate(found_t)
+        order = np.argsort(t_ext)
+        return t_ext[order], np.concatenate(found_y)[order], np.concatenate(found_max)[order]
+
+    def maxima(self):
+        """Instantes y profundidades de los puntos más bajos (máximos de y)."""
+        t_ext, y_ext, is_max = self.extrema()
+        return t_ext[is_max], y_ext[is_max]
+
+
+def integrate_rk4(acceleration, h, t_max, state0=(0.0, 0.0)):
+    """
+    Integra y'' = acceleration(y, v) con RK4 y paso h, guardando solo los
+    pasos (con su aceleración) en un objeto Trajectory.
+    """
+    n_steps = int(np.floor(t_max / h + 1e-9))
+    t = h * np.arange(n_steps + 1)
+    y = np.empty(n_steps + 1)
+    v = np.empty(n_steps + 1)
+    a = np.empty(n_steps + 1)
+
+    def state_derivative(current_state):
+        return np.array([current_state[1], acceleration(current_state[0], current_state[1])])
+
+    state = np.array(state0, dtype=float)
+    for i in range(n_steps + 1):
+        derivative = state_derivative(state)
+        y[i], v[i] = state
+        a[i] = derivative[1]
+        if i == n_steps:
+            break
+
+        k1_v = h * derivative
+        k2_v = h * state_derivative(state + 0.5 * k1_v)
+        k3_v = h * state_derivative(state + 0.5 * k2_v)
+        k4_v = h * state_derivative(state + k3_v)
+        state = state + (k1_v + 2 * k2_v + 2 * k3_v + k4_v) / 6.0
+
+    return Trajectory(t, y, v, a)